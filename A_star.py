@@ -1,97 +1,576 @@
-import heapq
+import sys
+from array import array
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - the pure-Python search is used instead
+    njit = None
+
+try:
+    from astar_core import astar as _astar_c  # Optional Cython build of the search core
+except ImportError:
+    _astar_c = None
 
 # ============================================================================
 # A* PATHFINDING - COMPLETE EXAMPLE WITH VISUALIZATION
 # ============================================================================
 
+OBSTACLE = ord('X')  # Byte value of an obstacle cell in the flattened grid
+
+# Neighbour offsets (up, down, left, right) and their labels for tracing
+_DIRS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIR_NAMES = ("⬆️ UP", "⬇️ DOWN", "⬅️ LEFT", "➡️ RIGHT")
+
+# How each cell is drawn by print_grid_with_path
+SYMBOL = {
+    'S': " 🚛",  # Start (trolley)
+    'E': " 🎯",  # Goal
+    'X': " 📦",  # Obstacle (box)
+    '•': " ●",   # Path
+    '.': " ·",   # Empty
+}
+
 def heuristic(pos, goal):
     """Manhattan distance - counts steps horizontally + vertically"""
     return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
 
-def a_star_pathfinding(grid, start, goal):
+def heappush4(heap, item):
+    """Push item onto a 4-ary min-heap kept in a plain list (children of i at 4i+1..4i+4)"""
+    heap.append(item)
+    i = len(heap) - 1
+    while i:
+        parent = (i - 1) >> 2
+        if heap[parent] <= item:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = item
+
+def heappop4(heap):
+    """Pop and return the smallest item from a 4-ary min-heap"""
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    size = len(heap)
+    i = 0
+    while True:
+        first = 4 * i + 1
+        if first >= size:
+            break
+        # Pick the smallest of up to four children
+        child = first
+        for j in range(first + 1, min(first + 4, size)):
+            if heap[j] < heap[child]:
+                child = j
+        if heap[child] >= last:
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = last
+    return top
+
+def _walk_parents(came_from, current, cols, path):
+    """Append every cell from current (exclusive) back to its root, filling in straight jumps"""
+    while current in came_from:
+        parent = came_from[current]
+        # Consecutive jump points share a row or a column
+        if parent // cols == current // cols:
+            step = 1 if parent > current else -1
+        else:
+            step = cols if parent > current else -cols
+        while current != parent:
+            current += step
+            path.append(divmod(current, cols))
+    return path
+
+def reconstruct_path(came_from, current, cols):
+    """Walk parent pointers back from packed index current and return (row, col) positions start -> current"""
+    path = _walk_parents(came_from, current, cols, [divmod(current, cols)])
+    path.reverse()
+    return path
+
+# Jump point search helpers, generated per grid shape so the row width, grid
+# size and obstacle byte are folded into the bytecode as constants and each
+# direction gets its own unrolled loop. {up_behind}/{down_behind} are the
+# offsets of the cells diagonally behind the current one, above and below.
+_HORIZONTAL_JUMP_SRC = """
+def {name}(grid_flat, idx, target):
+    {edge_init}
+    while True:
+        idx += {dc}
+        if {edge_test} or grid_flat[idx] == {obstacle}:
+            return -1
+        if idx == target:
+            return idx
+        if idx >= {cols} and grid_flat[idx - {cols}] != {obstacle} and grid_flat[idx + {up_behind}] == {obstacle}:
+            return idx
+        if idx < {last_row} and grid_flat[idx + {cols}] != {obstacle} and grid_flat[idx + {down_behind}] == {obstacle}:
+            return idx
+"""
+
+_VERTICAL_JUMP_SRC = """
+def {name}(grid_flat, idx, target):
+    while True:
+        idx += {delta}
+        if {edge_test} or grid_flat[idx] == {obstacle}:
+            return -1
+        if idx == target:
+            return idx
+        if jump_left(grid_flat, idx, target) >= 0 or jump_right(grid_flat, idx, target) >= 0:
+            return idx
+"""
+
+@lru_cache(maxsize=None)
+def _specialized_jumps(rows, cols):
     """
-    Find shortest path from start to goal avoiding obstacles (X)
+    Build jump functions (up, down, left, right) for a rows x cols grid
     
-    grid: 2D list where:
-        '.' = empty (can walk)
-        'X' = obstacle (cannot walk)
-    start: (row, col) starting position
-    goal: (row, col) ending position
-    
-    Returns: path (list of positions) or None if no path exists
+    Each takes (grid_flat, idx, target) and slides from packed index idx to the
+    next jump point: the target, or a cell where the path may have to turn
+    (horizontally: a free cell above/below whose neighbour behind is blocked;
+    vertically: a cell from which a horizontal jump finds one). Returns -1 on
+    hitting a wall or the grid edge.
     """
-    rows = len(grid)
-    cols = len(grid[0])
+    size = rows * cols
+    src = []
+    for name, dc, edge_init, edge_test in (
+        ("jump_left", -1, f"row_start = idx - idx % {cols}", "idx < row_start"),
+        ("jump_right", 1, f"row_end = idx - idx % {cols} + {cols}", "idx >= row_end"),
+    ):
+        src.append(_HORIZONTAL_JUMP_SRC.format(
+            name=name, dc=dc, edge_init=edge_init, edge_test=edge_test,
+            cols=cols, last_row=size - cols, obstacle=OBSTACLE,
+            up_behind=-cols - dc, down_behind=cols - dc,
+        ))
+    for name, delta, edge_test in (
+        ("jump_up", -cols, "idx < 0"),
+        ("jump_down", cols, f"idx >= {size}"),
+    ):
+        src.append(_VERTICAL_JUMP_SRC.format(
+            name=name, delta=delta, edge_test=edge_test, obstacle=OBSTACLE,
+        ))
+    namespace = {}
+    exec("".join(src), namespace)
+    return tuple(namespace[name] for name in ("jump_up", "jump_down", "jump_left", "jump_right"))
+
+# ============================================================================
+# COMPILED SEARCH CORE (used when Numba is installed, see also astar_core.pyx)
+# ============================================================================
+
+INF = np.iinfo(np.int32).max
+
+# Largest padded grid whose packed heap keys fit in an int64 (see _astar_kernel)
+KERNEL_MAX_CELLS = 1_000_000
+
+def _heap_push(heap, size, key):
+    """Push key onto a binary min-heap stored in an int64 array, return new size"""
+    i = size
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap[parent] <= key:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = key
+    return size + 1
+
+def _heap_pop(heap, size):
+    """Remove the root of the heap (caller reads it first), return new size"""
+    size -= 1
+    key = heap[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[child] >= key:
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = key
+    return size
+
+def _astar_kernel(cells, pcols, start, goal, g, parent, closed, heap):
+    """
+    A* over a padded uint8 grid, filling parent with the predecessor of each
+    reached cell (-1 if unreached). Returns True if goal was reached.
     
-    # Priority queue: (priority, cost, position, path)
-    open_set = [(0, 0, start, [start])]
-    visited = set()  # Track visited positions
+    cells is the grid flattened row-major and wrapped in a one-cell obstacle
+    border, so the four neighbours of any cell are fixed index offsets that
+    never need a bounds check - one load and compare each. g, parent, closed
+    and heap are caller-owned buffers that are reset here.
+    """
+    n = cells.shape[0]
+    g.fill(INF)
+    parent.fill(-1)
+    closed.fill(0)
     
-    print(f"\n{'='*60}")
-    print(f"🎯 FINDING PATH FROM {start} TO {goal}")
-    print(f"{'='*60}\n")
+    offsets = np.empty(4, np.int32)
+    for k in range(4):
+        offsets[k] = _DIRS[k][0] * pcols + _DIRS[k][1]
+    gr = goal // pcols
+    gc = goal - gr * pcols
+    sr = start // pcols
+    sc = start - sr * pcols
     
-    step = 0
+    # Heap entries are single int64 keys packing
+    # (priority, n - cost, index) as (priority * n + n - cost) * n + index,
+    # so ordering is one integer compare: lowest f first, deeper cells on ties.
+    # Every push is a strict improvement of one of at most 4 edges per cell.
+    g[start] = 0
+    size = _heap_push(heap, 0, (np.int64(abs(sr - gr) + abs(sc - gc)) * n + n) * n + start)
     
-    while open_set:
-        # Get node with lowest priority (most promising)
-        priority, cost, current, path = heapq.heappop(open_set)
+    while size > 0:
+        current = heap[0] % n
+        size = _heap_pop(heap, size)
         
-        step += 1
-        print(f"📍 Step {step}: At {current}, Cost={cost}, Priority={priority}")
+        if closed[current]:
+            continue
+        closed[current] = 1
         
-        # Skip if already visited
-        if current in visited:
-            print(f"   ⏭️  Already visited, skipping")
+        if current == goal:
+            return True
+        
+        r = current // pcols
+        c = current - r * pcols
+        new_cost = g[current] + 1
+        for k in range(4):
+            neighbor = current + offsets[k]
+            if cells[neighbor] == OBSTACLE or closed[neighbor]:
+                continue
+            if new_cost >= g[neighbor]:
+                continue
+            g[neighbor] = new_cost
+            parent[neighbor] = current
+            
+            h = abs(r + _DIRS[k][0] - gr) + abs(c + _DIRS[k][1] - gc)
+            size = _heap_push(heap, size, (np.int64(new_cost + h) * n + n - new_cost) * n + neighbor)
+    
+    return False
+
+def _label_components(cells, pcols, labels, stack):
+    """
+    Flood-fill every free cell of a padded grid with the id of its connected
+    region (0, 1, ...); obstacles keep -1. Returns the number of regions.
+    
+    labels must arrive filled with -1, and stack needs room for every cell.
+    Works on NumPy arrays under Numba and on bytes/array('i') in plain Python.
+    """
+    n = len(cells)
+    count = 0
+    for seed in range(pcols, n - pcols):
+        if cells[seed] == OBSTACLE or labels[seed] >= 0:
             continue
+        labels[seed] = count
+        stack[0] = seed
+        top = 1
+        while top > 0:
+            top -= 1
+            idx = stack[top]
+            for neighbor in (idx - pcols, idx + pcols, idx - 1, idx + 1):
+                if cells[neighbor] != OBSTACLE and labels[neighbor] < 0:
+                    labels[neighbor] = count
+                    stack[top] = neighbor
+                    top += 1
+        count += 1
+    return count
+
+if njit is not None:
+    # Explicit signatures compile (or load from cache) at import instead of on
+    # the first query, and pin the buffer dtypes: uint8 cells and closed flags,
+    # int32 costs and parents, int64 only where the packed heap keys need it
+    _heap_push = njit('i8(i8[::1], i8, i8)', cache=True)(_heap_push)
+    _heap_pop = njit('i8(i8[::1], i8)', cache=True)(_heap_pop)
+    _astar_kernel = njit('b1(u1[::1], i8, i8, i8, i4[::1], i4[::1], u1[::1], i8[::1])',
+                         cache=True)(_astar_kernel)
+    _label_components = njit('i8(u1[::1], i8, i4[::1], i4[::1])', cache=True)(_label_components)
+
+def _path_from_parents(parent, start, goal, pcols):
+    """Rebuild the (row, col) path from a padded-grid parent array"""
+    path = [(goal // pcols - 1, goal % pcols - 1)]
+    current = goal
+    while current != start:
+        current = int(parent[current])
+        path.append((current // pcols - 1, current % pcols - 1))
+    path.reverse()
+    return path
+
+# ============================================================================
+# SOLVER
+# ============================================================================
+
+class AStar:
+    """
+    A* pathfinder bound to one grid
+    
+    The flattened grid and every search buffer are allocated once here and
+    reset per query, so repeated solve() calls on the same grid don't pay for
+    fresh allocations. The grid is treated as fixed - build a new AStar when
+    boxes move.
+    
+    grid: 2D list where:
+        '.' = empty (can walk)
+        'X' = obstacle (cannot walk)
+    components: label connected regions up front so queries between regions
+        are answered without searching (worth it when solving many queries)
+    """
+    
+    def __init__(self, grid, components=True):
+        self.rows = rows = len(grid)
+        self.cols = cols = len(grid[0])
+        self.size = size = rows * cols
         
-        visited.add(current)
+        # Positions are packed as row * cols + col for the whole search, and
+        # the grid is flattened to one contiguous byte string for obstacle lookups
+        self.grid_flat = ''.join(map(''.join, grid)).encode('ascii')
         
-        # ✅ GOAL REACHED!
-        if current == goal:
+        # Packed-index offset and same-row flag for each direction
+        self.moves = tuple((dr * cols + dc, dc != 0) for dr, dc in _DIRS)
+        self.jumps = _specialized_jumps(rows, cols)
+        
+        # Python search state: open sets, best costs and parent pointers per
+        # frontier, plus heuristic caches (-1 = not computed yet) that stay
+        # valid while their frontier's target is unchanged
+        self._open = ([], [])
+        self._g = ({}, {})
+        self._came_from = ({}, {})
+        self._h_blank = array('i', [-1]) * size
+        self._h_cache = (array('i', self._h_blank), array('i', self._h_blank))
+        self._h_target = [-1, -1]
+        
+        # The Cython core (astar_core.pyx) is preferred when it has been built
+        fits = (rows + 2) * (cols + 2) <= KERNEL_MAX_CELLS
+        self.use_extension = _astar_c is not None and fits
+        if self.use_extension:
+            self._grid_u8 = np.frombuffer(self.grid_flat, dtype=np.uint8).reshape(rows, cols)
+        
+        # Copy of the grid with an obstacle border, so neighbour lookups in the
+        # compiled core and the region labelling never need bounds checks
+        self.use_kernel = njit is not None and fits and not self.use_extension
+        self._pcols = pcols = cols + 2
+        cells = np.full((rows + 2, pcols), OBSTACLE, np.uint8)
+        cells[1:-1, 1:-1] = np.frombuffer(self.grid_flat, dtype=np.uint8).reshape(rows, cols)
+        self._cells = cells = cells.ravel()
+        n = cells.shape[0]
+        
+        # Connected region of each padded cell (-1 = obstacle)
+        self.component = None
+        if components:
+            if njit is not None:
+                self.component = np.full(n, -1, np.int32)
+                _label_components(cells, pcols, self.component, np.empty(n, np.int32))
+            else:
+                self.component = array('i', [-1]) * n
+                _label_components(cells.tobytes(), pcols, self.component, array('i', [0]) * n)
+        
+        # Compiled core buffers
+        if self.use_kernel:
+            self._kernel_g = np.empty(n, np.int32)
+            self._kernel_parent = np.empty(n, np.int32)
+            self._kernel_closed = np.empty(n, np.uint8)
+            self._kernel_heap = np.empty(4 * n + 1, np.int64)
+    
+    def solve(self, start, goal, verbose=False):
+        """
+        Find shortest path from start to goal avoiding obstacles (X)
+        
+        start: (row, col) starting position
+        goal: (row, col) ending position
+        verbose: print a step-by-step trace of the search
+        
+        Returns: path (list of positions) or None if no path exists
+        """
+        cols = self.cols
+        size = self.size
+        grid_flat = self.grid_flat
+        moves = self.moves
+        jumps = self.jumps
+        start_i = start[0] * cols + start[1]
+        goal_i = goal[0] * cols + goal[1]
+        
+        pcols = self._pcols
+        start_p = (start[0] + 1) * pcols + start[1] + 1
+        goal_p = (goal[0] + 1) * pcols + goal[1] + 1
+        
+        # Start and goal in different regions (or goal on a box) - nothing to search
+        if self.component is not None:
+            region = self.component[start_p]
+            if region >= 0 and region != self.component[goal_p]:
+                if verbose:
+                    print(f"\n❌ NO PATH FOUND! {start} and {goal} are not connected\n")
+                return None
+        
+        # Hand the search to a compiled core unless we need the step trace
+        if self.use_extension and not verbose:
+            return _astar_c(self._grid_u8, start[0], start[1], goal[0], goal[1])
+        if self.use_kernel and not verbose:
+            if not _astar_kernel(self._cells, pcols, start_p, goal_p, self._kernel_g,
+                                 self._kernel_parent, self._kernel_closed, self._kernel_heap):
+                return None
+            return _path_from_parents(self._kernel_parent, start_p, goal_p, pcols)
+        
+        if start_i == goal_i:
+            return [start]
+        if grid_flat[goal_i] == OBSTACLE:
+            return None
+        
+        # Bidirectional search: a forward frontier grows from start and a backward
+        # frontier from goal, each with its own priority queue of
+        # (priority, cost, index), best known costs and parent pointers.
+        # Both frontiers use jump point search, so only jump points are queued
+        # and parent pointers skip over the straight runs between them.
+        open_fwd, open_bwd = self._open
+        g_fwd, g_bwd = self._g
+        came_from_fwd, came_from_bwd = self._came_from
+        for state in (open_fwd, open_bwd, g_fwd, g_bwd, came_from_fwd, came_from_bwd):
+            state.clear()
+        open_fwd.append((0, 0, start_i))
+        open_bwd.append((0, 0, goal_i))
+        g_fwd[start_i] = 0
+        g_bwd[goal_i] = 0
+        
+        h_fwd, h_bwd = self._h_cache
+        for k, target in enumerate((goal_i, start_i)):
+            if self._h_target[k] != target:
+                self._h_cache[k][:] = self._h_blank
+                self._h_target[k] = target
+        
+        sides = (
+            ("▶ FWD", open_fwd, g_fwd, came_from_fwd, g_bwd, goal_i, goal[0], goal[1], h_fwd),
+            ("◀ BWD", open_bwd, g_bwd, came_from_bwd, g_fwd, start_i, start[0], start[1], h_bwd),
+        )
+        if grid_flat[start_i] == OBSTACLE:
+            # Like the compiled cores, a start on a box may still be left, but
+            # nothing can jump onto it, so the backward frontier would never
+            # meet the forward one. Search forward only: the goal stays queued
+            # as the backward root, so reaching it counts as the meeting.
+            sides = sides[:1]
+        
+        best = float('inf')  # Length of the best complete path seen so far
+        meet = None  # Cell where that path joins the two frontiers
+        
+        if verbose:
             print(f"\n{'='*60}")
-            print(f"✅ PATH FOUND! Total steps: {cost}")
-            print(f"{'='*60}")
-            return path
+            print(f"🎯 FINDING PATH FROM {start} TO {goal}")
+            print(f"{'='*60}\n")
         
-        # Check 4 neighbors (up, down, left, right)
-        directions = [
-            (-1, 0, "⬆️ UP"),
-            (1, 0, "⬇️ DOWN"),
-            (0, -1, "⬅️ LEFT"),
-            (0, 1, "➡️ RIGHT")
-        ]
+        step = 0
         
-        for dr, dc, direction_name in directions:
-            neighbor = (current[0] + dr, current[1] + dc)
-            nr, nc = neighbor
+        while open_fwd and open_bwd:
+            # Neither frontier can improve on the best meeting found so far
+            if open_fwd[0][0] >= best or open_bwd[0][0] >= best:
+                break
             
-            # Check bounds
-            if not (0 <= nr < rows and 0 <= nc < cols):
-                continue
+            # Alternate between the two frontiers
+            label, open_set, g_score, came_from, other_g, target, tr, tc, h_cache = sides[step % len(sides)]
             
-            # Check obstacle
-            if grid[nr][nc] == 'X':
-                continue
+            # Get node with lowest priority (most promising)
+            priority, cost, current = heappop4(open_set)
             
-            # Skip if visited
-            if neighbor in visited:
+            step += 1
+            if verbose:
+                print(f"📍 Step {step} {label}: At {divmod(current, cols)}, Cost={cost}, Priority={priority}")
+            
+            # Skip stale entries - a cheaper route to this cell was queued later.
+            # With a consistent heuristic the first live pop of a cell is final,
+            # so no separate visited set is needed.
+            if cost > g_score[current]:
+                if verbose:
+                    print(f"   ⏭️  Stale entry, skipping")
                 continue
             
-            # Calculate costs
-            new_cost = cost + 1
-            h = heuristic(neighbor, goal)
-            new_priority = new_cost + h
+            # Prune directions by how we arrived. Paths are kept canonical by
+            # turning from horizontal to vertical only where an obstacle forces it.
+            parent = came_from.get(current)
+            if parent is None:
+                # Root of this frontier: try all 4 directions
+                directions = (0, 1, 2, 3)
+            elif parent // cols == current // cols:
+                # Arrived horizontally: keep going, plus any forced vertical turns
+                dc = 1 if current > parent else -1
+                directions = [3 if dc == 1 else 2]
+                up = current - cols
+                if up >= 0 and grid_flat[up] != OBSTACLE and grid_flat[up - dc] == OBSTACLE:
+                    directions.append(0)
+                down = current + cols
+                if down < size and grid_flat[down] != OBSTACLE and grid_flat[down - dc] == OBSTACLE:
+                    directions.append(1)
+            else:
+                # Arrived vertically: keep going and branch both ways along the row
+                directions = (1 if current > parent else 0, 2, 3)
             
-            print(f"   {direction_name} → {neighbor}: cost={new_cost}, h={h}, priority={new_priority}")
+            for k in directions:
+                delta, horizontal = moves[k]
+                
+                # Jump to the next interesting cell in this direction
+                neighbor = jumps[k](grid_flat, current, target)
+                if neighbor < 0:
+                    continue
+                
+                # Calculate costs (the jump is a straight run of unit steps)
+                distance = neighbor - current if neighbor > current else current - neighbor
+                new_cost = cost + (distance if horizontal else distance // cols)
+                
+                # Only keep improvements over the best known route
+                if new_cost >= g_score.get(neighbor, float('inf')):
+                    continue
+                g_score[neighbor] = new_cost
+                came_from[neighbor] = current
+                
+                h = h_cache[neighbor]
+                if h < 0:
+                    # Manhattan distance to this frontier's target, inlined
+                    nr, nc = divmod(neighbor, cols)
+                    h = (nr - tr if nr >= tr else tr - nr) + (nc - tc if nc >= tc else tc - nc)
+                    h_cache[neighbor] = h
+                new_priority = new_cost + h
+                
+                if verbose:
+                    print(f"   {_DIR_NAMES[k]} → {divmod(neighbor, cols)}: cost={new_cost}, h={h}, priority={new_priority}")
+                
+                # 🤝 The other frontier already reached this cell
+                if neighbor in other_g and new_cost + other_g[neighbor] < best:
+                    best = new_cost + other_g[neighbor]
+                    meet = neighbor
+                    if verbose:
+                        print(f"   🤝 Frontiers meet at {divmod(neighbor, cols)}: total={best}")
+                
+                # Add to queue
+                heappush4(open_set, (new_priority, new_cost, neighbor))
             
-            # Add to queue
-            heapq.heappush(open_set, (new_priority, new_cost, neighbor, path + [neighbor]))
+            if verbose:
+                print()
         
-        print()
+        if meet is None:
+            if verbose:
+                print("\n❌ NO PATH FOUND!\n")
+            return None
+        
+        # ✅ PATH FOUND - splice start -> meet with meet -> goal
+        if verbose:
+            print(f"\n{'='*60}")
+            print(f"✅ PATH FOUND! Total steps: {best}")
+            print(f"{'='*60}")
+        path = reconstruct_path(came_from_fwd, meet, cols)
+        return _walk_parents(came_from_bwd, meet, cols, path)
+
+def a_star_pathfinding(grid, start, goal, verbose=False):
+    """
+    Find shortest path from start to goal avoiding obstacles (X)
     
-    print("\n❌ NO PATH FOUND!\n")
-    return None
+    One-off convenience wrapper around AStar(grid).solve(start, goal); build
+    an AStar once and reuse it when querying the same grid repeatedly.
+    
+    Returns: path (list of positions) or None if no path exists
+    """
+    # A single query can't earn back the cost of labelling every region
+    return AStar(grid, components=False).solve(start, goal, verbose)
 
 def print_grid_with_path(grid, path=None, start=None, goal=None):
     """Print grid with path visualization"""
@@ -116,141 +595,133 @@ def print_grid_with_path(grid, path=None, start=None, goal=None):
     if goal:
         display[goal[0]][goal[1]] = 'E'
     
-    # Print
+    # Print - each row is built as one string so the whole grid goes out in one write
     print("\n" + "="*60)
     print("GRID LAYOUT:")
     print("="*60)
-    print("  ", end="")
-    for c in range(cols):
-        print(f" {c}", end="")
-    print()
-    
+    row_strs = ["  " + "".join(f" {c}" for c in range(cols))]
     for r in range(rows):
-        print(f"{r:2d} ", end="")
+        parts = [f"{r:2d} "]
         for c in range(cols):
-            cell = display[r][c]
-            if cell == 'S':
-                print(" 🚛", end="")  # Start (trolley)
-            elif cell == 'E':
-                print(" 🎯", end="")  # Goal
-            elif cell == 'X':
-                print(" 📦", end="")  # Obstacle (box)
-            elif cell == '•':
-                print(" ●", end="")  # Path
-            else:
-                print(" ·", end="")  # Empty
-        print()
+            parts.append(SYMBOL.get(display[r][c], SYMBOL['.']))
+        row_strs.append("".join(parts))
+    sys.stdout.write("\n".join(row_strs) + "\n")
     print("="*60)
     print("Legend: 🚛=Start, 🎯=Goal, 📦=Box, ●=Path, ·=Empty\n")
 
-# ============================================================================
-# EXAMPLE 1: SIMPLE PATH (NO OBSTACLES)
-# ============================================================================
+if __name__ == "__main__":
+    # ============================================================================
+    # EXAMPLE 1: SIMPLE PATH (NO OBSTACLES)
+    # ============================================================================
 
-print("\n" + "🔵"*30)
-print("EXAMPLE 1: SIMPLE PATH - NO OBSTACLES")
-print("🔵"*30)
+    print("\n" + "🔵"*30)
+    print("EXAMPLE 1: SIMPLE PATH - NO OBSTACLES")
+    print("🔵"*30)
 
-grid1 = [
-    ['.', '.', '.', '.', '.'],
-    ['.', '.', '.', '.', '.'],
-    ['.', '.', '.', '.', '.'],
-    ['.', '.', '.', '.', '.'],
-    ['.', '.', '.', '.', '.']
-]
+    grid1 = [
+        ['.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.'],
+        ['.', '.', '.', '.', '.']
+    ]
 
-start1 = (0, 0)  # Top-left
-goal1 = (4, 4)   # Bottom-right
+    start1 = (0, 0)  # Top-left
+    goal1 = (4, 4)   # Bottom-right
 
-print_grid_with_path(grid1, start=start1, goal=goal1)
-path1 = a_star_pathfinding(grid1, start1, goal1)
+    print_grid_with_path(grid1, start=start1, goal=goal1)
+    astar1 = AStar(grid1)
+    path1 = astar1.solve(start1, goal1, verbose=True)
 
-if path1:
-    print(f"\n📍 Final Path: {path1}")
-    print(f"📏 Path Length: {len(path1)} steps")
-    print_grid_with_path(grid1, path1, start1, goal1)
+    if path1:
+        print(f"\n📍 Final Path: {path1}")
+        print(f"📏 Path Length: {len(path1)} steps")
+        print_grid_with_path(grid1, path1, start1, goal1)
 
-# ============================================================================
-# EXAMPLE 2: PATH WITH OBSTACLES
-# ============================================================================
+    # ============================================================================
+    # EXAMPLE 2: PATH WITH OBSTACLES
+    # ============================================================================
 
-print("\n" + "🟡"*30)
-print("EXAMPLE 2: PATH AROUND OBSTACLES")
-print("🟡"*30)
+    print("\n" + "🟡"*30)
+    print("EXAMPLE 2: PATH AROUND OBSTACLES")
+    print("🟡"*30)
 
-grid2 = [
-    ['.', '.', '.', '.', '.'],
-    ['.', 'X', 'X', 'X', '.'],
-    ['.', '.', '.', 'X', '.'],
-    ['.', 'X', '.', 'X', '.'],
-    ['.', '.', '.', '.', '.']
-]
+    grid2 = [
+        ['.', '.', '.', '.', '.'],
+        ['.', 'X', 'X', 'X', '.'],
+        ['.', '.', '.', 'X', '.'],
+        ['.', 'X', '.', 'X', '.'],
+        ['.', '.', '.', '.', '.']
+    ]
 
-start2 = (0, 0)  # Top-left
-goal2 = (0, 4)   # Top-right
+    start2 = (0, 0)  # Top-left
+    goal2 = (0, 4)   # Top-right
 
-print_grid_with_path(grid2, start=start2, goal=goal2)
-path2 = a_star_pathfinding(grid2, start2, goal2)
+    print_grid_with_path(grid2, start=start2, goal=goal2)
+    astar2 = AStar(grid2)
+    path2 = astar2.solve(start2, goal2, verbose=True)
 
-if path2:
-    print(f"\n📍 Final Path: {path2}")
-    print(f"📏 Path Length: {len(path2)} steps")
-    print_grid_with_path(grid2, path2, start2, goal2)
+    if path2:
+        print(f"\n📍 Final Path: {path2}")
+        print(f"📏 Path Length: {len(path2)} steps")
+        print_grid_with_path(grid2, path2, start2, goal2)
 
-# ============================================================================
-# EXAMPLE 3: WAREHOUSE SCENARIO (LIKE YOUR ASRS)
-# ============================================================================
+    # ============================================================================
+    # EXAMPLE 3: WAREHOUSE SCENARIO (LIKE YOUR ASRS)
+    # ============================================================================
 
-print("\n" + "🟢"*30)
-print("EXAMPLE 3: WAREHOUSE SCENARIO")
-print("🟢"*30)
+    print("\n" + "🟢"*30)
+    print("EXAMPLE 3: WAREHOUSE SCENARIO")
+    print("🟢"*30)
 
-# Trolley at bottom-left, box at top-right
-grid3 = [
-    ['.', '.', '.', 'X', '.', '.', '.'],
-    ['.', 'X', '.', 'X', '.', 'X', '.'],
-    ['.', 'X', '.', '.', '.', 'X', '.'],
-    ['.', '.', '.', 'X', '.', '.', '.'],
-    ['.', '.', '.', '.', '.', '.', '.']
-]
+    # Trolley at bottom-left, box at top-right
+    grid3 = [
+        ['.', '.', '.', 'X', '.', '.', '.'],
+        ['.', 'X', '.', 'X', '.', 'X', '.'],
+        ['.', 'X', '.', '.', '.', 'X', '.'],
+        ['.', '.', '.', 'X', '.', '.', '.'],
+        ['.', '.', '.', '.', '.', '.', '.']
+    ]
 
-start3 = (4, 0)  # Bottom-left (trolley origin)
-goal3 = (0, 6)   # Top-right (box location)
+    start3 = (4, 0)  # Bottom-left (trolley origin)
+    goal3 = (0, 6)   # Top-right (box location)
 
-print_grid_with_path(grid3, start=start3, goal=goal3)
-path3 = a_star_pathfinding(grid3, start3, goal3)
+    print_grid_with_path(grid3, start=start3, goal=goal3)
+    astar3 = AStar(grid3)
+    path3 = astar3.solve(start3, goal3, verbose=True)
 
-if path3:
-    print(f"\n📍 Final Path: {path3}")
-    print(f"📏 Path Length: {len(path3)} steps")
-    print(f"🚛 Trolley would travel: {len(path3) - 1} moves")
-    print_grid_with_path(grid3, path3, start3, goal3)
+    if path3:
+        print(f"\n📍 Final Path: {path3}")
+        print(f"📏 Path Length: {len(path3)} steps")
+        print(f"🚛 Trolley would travel: {len(path3) - 1} moves")
+        print_grid_with_path(grid3, path3, start3, goal3)
 
-# ============================================================================
-# EXAMPLE 4: NO PATH POSSIBLE
-# ============================================================================
+    # ============================================================================
+    # EXAMPLE 4: NO PATH POSSIBLE
+    # ============================================================================
 
-print("\n" + "🔴"*30)
-print("EXAMPLE 4: NO PATH (COMPLETELY BLOCKED)")
-print("🔴"*30)
+    print("\n" + "🔴"*30)
+    print("EXAMPLE 4: NO PATH (COMPLETELY BLOCKED)")
+    print("🔴"*30)
 
-grid4 = [
-    ['.', '.', '.', '.', '.'],
-    ['.', 'X', 'X', 'X', '.'],
-    ['.', 'X', '.', 'X', '.'],
-    ['.', 'X', 'X', 'X', '.'],
-    ['.', '.', '.', '.', '.']
-]
+    grid4 = [
+        ['.', '.', '.', '.', '.'],
+        ['.', 'X', 'X', 'X', '.'],
+        ['.', 'X', '.', 'X', '.'],
+        ['.', 'X', 'X', 'X', '.'],
+        ['.', '.', '.', '.', '.']
+    ]
 
-start4 = (2, 2)  # Inside the box
-goal4 = (0, 0)   # Outside
+    start4 = (2, 2)  # Inside the box
+    goal4 = (0, 0)   # Outside
 
-print_grid_with_path(grid4, start=start4, goal=goal4)
-path4 = a_star_pathfinding(grid4, start4, goal4)
+    print_grid_with_path(grid4, start=start4, goal=goal4)
+    astar4 = AStar(grid4)
+    path4 = astar4.solve(start4, goal4, verbose=True)
 
-if not path4:
-    print("⚠️  As expected, no path exists!")
+    if not path4:
+        print("⚠️  As expected, no path exists!")
 
-print("\n" + "="*60)
-print("✨ A* PATHFINDING DEMO COMPLETE!")
-print("="*60)
+    print("\n" + "="*60)
+    print("✨ A* PATHFINDING DEMO COMPLETE!")
+    print("="*60)
@@ -7,11 +7,24 @@ ABB UI Replica (PySide6)
 - Stacked pages: Status, Model Tray Config, Material I/O Search, Tray Partition, Call Tray History
 - System tray with the same "Model Tray Configuration" default action for now
 - No console logs (except critical errors)
+- Performance work targets Qt: cached icons/fonts/brushes, one app stylesheet,
+  pages built on first visit, model-backed tables. Numba JIT is intentionally
+  not used - there are no numeric hot loops and its import cost would slow startup
 """
-import math
 import sys
 
-from PySide6.QtCore import QDateTime, QPointF, QRectF, Qt, QTimer, QSize
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QByteArray,
+    QDateTime,
+    QEvent,
+    QModelIndex,
+    QRectF,
+    Qt,
+    QTimer,
+    QSize,
+    Signal,
+)
 from PySide6.QtGui import (
     QAction,
     QBrush,
@@ -19,10 +32,10 @@ from PySide6.QtGui import (
     QFont,
     QIcon,
     QPainter,
-    QPainterPath,
     QPen,
     QPixmap,
 )
+from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -43,9 +56,9 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QStackedWidget,
     QStyle,
+    QStyledItemDelegate,
     QSystemTrayIcon,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QToolButton,
     QVBoxLayout,
     QWidget,
@@ -59,183 +72,123 @@ DARK = "#1f2937"
 GREEN = "#2ea043"
 RED = "#e11d48"
 
+HOME_TILES = [
+    ("Tray Data", "#d16436"),
+    ("Inventory List", "#3b7bdc"),
+    ("Material Tracking", "#d6688f"),
+    ("Available Space", "#2db16b"),
+    ("Call Tray Details", "#1aa196"),
+    ("Machine Status", "#a58a3a"),
+    ("Tray Configuration", "#d8a540"),
+    ("Tray Partition", "#1a3f8f"),
+]
+
 ICON_DIAMETER = 58
 STATUS_PILL_TEXT = "98% Machine Slots Utilized"
 
 
-def _draw_icon(draw_fn, size=64, *, pen_color=LIGHT, pen_width=4, padding=10):
-    """Render a stroked icon with the supplied painter callback."""
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.Antialiasing)
-    rect = QRectF(padding, padding, size - padding * 2, size - padding * 2)
-    painter.setPen(QPen(QColor(pen_color), pen_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-    painter.setBrush(Qt.NoBrush)
-    draw_fn(painter, rect)
-    painter.end()
-    return QIcon(pm)
-
-
-def _draw_user(painter, rect):
-    center = rect.center()
-    head_radius = rect.width() * 0.24
-    painter.drawEllipse(QPointF(center.x(), rect.top() + head_radius + 2), head_radius, head_radius)
-    body_rect = QRectF(
-        center.x() - rect.width() * 0.32,
-        rect.top() + rect.height() * 0.45,
-        rect.width() * 0.64,
-        rect.height() * 0.40,
-    )
-    path = QPainterPath()
-    path.addRoundedRect(body_rect, body_rect.height() / 2, body_rect.height() / 2)
-    painter.drawPath(path)
-
-
-def _draw_home(painter, rect):
-    roof_height = rect.height() * 0.42
-    path = QPainterPath()
-    path.moveTo(rect.center().x(), rect.top())
-    path.lineTo(rect.left() + rect.width() * 0.08, rect.top() + roof_height)
-    path.lineTo(rect.left() + rect.width() * 0.08, rect.bottom())
-    path.lineTo(rect.right() - rect.width() * 0.08, rect.bottom())
-    path.lineTo(rect.right() - rect.width() * 0.08, rect.top() + roof_height)
-    path.closeSubpath()
-    painter.drawPath(path)
-    door_rect = QRectF(
-        rect.center().x() - rect.width() * 0.12,
-        rect.bottom() - rect.height() * 0.28,
-        rect.width() * 0.24,
-        rect.height() * 0.28,
+def _rounded_rect_path(x, y, w, h, r):
+    """SVG path data for a rounded rect (radius clamped like QPainter.drawRoundedRect)."""
+    rx, ry = min(r, w / 2), min(r, h / 2)
+    return (
+        f"M{x + rx:g} {y:g} H{x + w - rx:g} A{rx:g} {ry:g} 0 0 1 {x + w:g} {y + ry:g} "
+        f"V{y + h - ry:g} A{rx:g} {ry:g} 0 0 1 {x + w - rx:g} {y + h:g} "
+        f"H{x + rx:g} A{rx:g} {ry:g} 0 0 1 {x:g} {y + h - ry:g} "
+        f"V{y + ry:g} A{rx:g} {ry:g} 0 0 1 {x + rx:g} {y:g} Z"
     )
-    painter.drawRoundedRect(door_rect, 6, 6)
 
 
-def _draw_fetch(painter, rect):
-    top = rect.top() + rect.height() * 0.15
-    mid = rect.center().y()
-    painter.drawLine(QPointF(rect.center().x(), top), QPointF(rect.center().x(), mid))
-    painter.drawLine(
-        QPointF(rect.center().x(), mid),
-        QPointF(rect.center().x() - rect.width() * 0.1, mid - rect.height() * 0.1),
-    )
-    painter.drawLine(
-        QPointF(rect.center().x(), mid),
-        QPointF(rect.center().x() + rect.width() * 0.1, mid - rect.height() * 0.1),
-    )
-    tray_rect = QRectF(
-        rect.left() + rect.width() * 0.18,
-        rect.bottom() - rect.height() * 0.30,
-        rect.width() * 0.64,
-        rect.height() * 0.22,
-    )
-    painter.drawRoundedRect(tray_rect, 6, 6)
-
-
-def _draw_storage(painter, rect):
-    cols = 2
-    rows = 3
-    cell_w = rect.width() * 0.42
-    cell_h = rect.height() * 0.26
-    start_x = rect.left() + rect.width() * 0.04
-    start_y = rect.top() + rect.height() * 0.06
-    gap_x = rect.width() * 0.06
-    gap_y = rect.height() * 0.07
-    for r in range(rows):
-        for c in range(cols):
-            painter.drawRoundedRect(
-                QRectF(
-                    start_x + c * (cell_w + gap_x),
-                    start_y + r * (cell_h + gap_y),
-                    cell_w,
-                    cell_h,
-                ),
-                6,
-                6,
-            )
-
-
-def _draw_settings(painter, rect):
-    center = rect.center()
-    outer = rect.width() * 0.32
-    inner = rect.width() * 0.14
-    for i in range(6):
-        angle = math.radians(60 * i)
-        start = QPointF(
-            center.x() + math.cos(angle) * (outer - 2),
-            center.y() + math.sin(angle) * (outer - 2),
-        )
-        end = QPointF(
-            center.x() + math.cos(angle) * (outer + 8),
-            center.y() + math.sin(angle) * (outer + 8),
+# Action bar icons as 64x64 SVG, white round-capped strokes on transparent
+_ICON_SVG = {
+    "user": (
+        '<circle cx="32" cy="22.56" r="10.56"/>'
+        '<rect x="17.92" y="29.8" width="28.16" height="17.6" rx="8.8"/>'
+    ),
+    "home": (
+        '<path d="M32 10 L13.52 28.48 L13.52 54 L50.48 54 L50.48 28.48 Z"/>'
+        '<rect x="26.72" y="41.68" width="10.56" height="12.32" rx="6"/>'
+    ),
+    "fetch": (
+        '<path d="M32 16.6 V32 M32 32 L27.6 27.6 M32 32 L36.4 27.6"/>'
+        '<rect x="17.92" y="40.8" width="28.16" height="9.68" rx="6"/>'
+    ),
+    # All six cells in one path, so the renderer strokes them in a single call
+    "storage": '<path d="{}"/>'.format(" ".join(
+        _rounded_rect_path(x, y, 18.48, 11.44, 6)
+        for y in (12.64, 27.16, 41.68)
+        for x in (11.76, 32.88)
+    )),
+    "settings": (
+        '<path d="M44.08 32 L54.08 32 M38.04 42.46 L43.04 51.12 M25.96 42.46 L20.96 51.12 '
+        'M19.92 32 L9.92 32 M25.96 21.54 L20.96 12.88 M38.04 21.54 L43.04 12.88"/>'
+        '<circle cx="32" cy="32" r="14.08"/>'
+        '<circle cx="32" cy="32" r="6.16"/>'
+    ),
+    "monitor": (
+        '<rect x="13.52" y="18.8" width="36.96" height="18.48" rx="6"/>'
+        '<path d="M32 37.28 V40.8"/>'
+        '<rect x="22.32" y="40.8" width="19.36" height="7.04" rx="6"/>'
+    ),
+    "power": (
+        '<path d="M42.58 21.42 A14.96 14.96 0 1 0 42.58 42.58"/>'
+        '<path d="M32 12.2 V32"/>'
+    ),
+}
+
+_ICONS = {}
+
+
+def _icon(name, size=64):
+    """Return the named action bar icon, rasterizing its SVG on first use only.
+
+    The pixmap is rendered at the screen's device pixel ratio so hi-DPI displays
+    get native-resolution pixels instead of an upscale at paint time.
+    """
+    app = QApplication.instance()
+    dpr = app.devicePixelRatio() if app else 1.0
+    icon = _ICONS.get((name, size, dpr))
+    if icon is None:
+        svg = (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="64" height="64" viewBox="0 0 64 64" '
+            f'fill="none" stroke="{LIGHT}" stroke-width="4" stroke-linecap="round" '
+            f'stroke-linejoin="round">{_ICON_SVG[name]}</svg>'
         )
-        painter.drawLine(start, end)
-    painter.drawEllipse(center, outer, outer)
-    painter.drawEllipse(center, inner, inner)
-
-
-def _draw_monitor(painter, rect):
-    screen = QRectF(
-        rect.left() + rect.width() * 0.08,
-        rect.top() + rect.height() * 0.20,
-        rect.width() * 0.84,
-        rect.height() * 0.42,
-    )
-    painter.drawRoundedRect(screen, 6, 6)
-    stem_top = screen.bottom() + rect.height() * 0.08
-    painter.drawLine(
-        QPointF(rect.center().x(), screen.bottom()),
-        QPointF(rect.center().x(), stem_top),
-    )
-    base = QRectF(
-        rect.center().x() - rect.width() * 0.22,
-        stem_top,
-        rect.width() * 0.44,
-        rect.height() * 0.16,
-    )
-    painter.drawRoundedRect(base, 6, 6)
-
-
-def _draw_power(painter, rect):
-    center = rect.center()
-    radius = rect.width() * 0.34
-    painter.drawArc(
-        QRectF(center.x() - radius, center.y() - radius, radius * 2, radius * 2),
-        45 * 16,
-        270 * 16,
-    )
-    painter.drawLine(
-        QPointF(center.x(), rect.top() + rect.height() * 0.05),
-        QPointF(center.x(), center.y()),
-    )
+        pm = QPixmap(int(size * dpr), int(size * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        painter = QPainter(pm)
+        QSvgRenderer(QByteArray(svg.encode())).render(painter, QRectF(0, 0, size, size))
+        painter.end()
+        icon = _ICONS[(name, size, dpr)] = QIcon(pm)
+    return icon
 
 
 def icon_user():
-    return _draw_icon(_draw_user)
+    return _icon("user")
 
 
 def icon_home():
-    return _draw_icon(_draw_home)
+    return _icon("home")
 
 
 def icon_fetch():
-    return _draw_icon(_draw_fetch)
+    return _icon("fetch")
 
 
 def icon_storage():
-    return _draw_icon(_draw_storage)
+    return _icon("storage")
 
 
 def icon_settings():
-    return _draw_icon(_draw_settings)
+    return _icon("settings")
 
 
 def icon_monitor():
-    return _draw_icon(_draw_monitor)
+    return _icon("monitor")
 
 
 def icon_power():
-    return _draw_icon(_draw_power)
+    return _icon("power")
 
 
 def orange_button(text):
@@ -259,23 +212,117 @@ def tile_button(text, color):
     b = QPushButton(text)
     b.setCursor(Qt.PointingHandCursor)
     b.setObjectName("HomeTile")
-    b.setStyleSheet(
-        f"QPushButton#HomeTile {{ background:{color}; color:white; border:none; border-radius:14px; padding:18px 16px; font-weight:600; font-size:14px; }}"
-    )
+    b.setProperty("tileColor", color)  # background comes from APP_QSS
     b.setMinimumSize(50, 90)
     return b
 
 
+_BRUSHES = {}
+
+
+def _brush(color):
+    """Return a shared solid QBrush, created on first use (once QApplication exists)."""
+    brush = _BRUSHES.get(color)
+    if brush is None:
+        brush = _BRUSHES[color] = QBrush(QColor(color))
+    return brush
+
+
+_FONT_CACHE = {}
+
+
+def _font(size, bold=False, italic=False, weight=None):
+    """Return a shared "Segoe UI" QFont, resolving each style only once."""
+    key = (size, bold, italic, weight)
+    f = _FONT_CACHE.get(key)
+    if f is None:
+        f = QFont("Segoe UI")
+        f.setPointSize(size)
+        f.setBold(bold)
+        f.setItalic(italic)
+        if weight is not None:
+            f.setWeight(weight)
+        _FONT_CACHE[key] = f
+    return f
+
+
 def label(text, bold=False, size=12, color=DARK):
     l = QLabel(text)
-    f = QFont("Segoe UI")
-    f.setPointSize(size)
-    f.setBold(bold)
-    l.setFont(f)
+    l.setFont(_font(size, bold))
     l.setStyleSheet(f"color:{color};")
     return l
 
 
+class SimpleTableModel(QAbstractTableModel):
+    """Read-only table model over a list of row tuples; cells are produced on demand."""
+
+    def __init__(self, headers, rows, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = list(rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints a cell's text as a push button, so action columns need no widget per row."""
+
+    clicked = Signal(int, int)  # row, column
+
+    def __init__(self, accent=False, parent=None):
+        super().__init__(parent)
+        self._accent = accent
+
+    def paint(self, painter, option, index):
+        rect = QRectF(option.rect).adjusted(6, 4, -6, -4)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        if self._accent:
+            painter.setPen(QPen(QColor(ORANGE_DARK), 1))
+            painter.setBrush(QColor(ORANGE))
+            text_color = LIGHT
+        else:
+            painter.setPen(QPen(QColor("#d1d5db"), 1))
+            painter.setBrush(QColor("#e5e7eb"))
+            text_color = DARK
+        painter.drawRoundedRect(rect, 8, 8)
+        font = QFont(option.font)
+        font.setBold(self._accent)
+        painter.setFont(font)
+        painter.setPen(QColor(text_color))
+        painter.drawText(rect, Qt.AlignCenter, index.data())
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            self.clicked.emit(index.row(), index.column())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+def data_table(headers, rows):
+    tbl = QTableView()
+    tbl.setModel(SimpleTableModel(headers, rows, tbl))
+    tbl.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    tbl.horizontalHeader().setFixedHeight(46)
+    tbl.verticalHeader().setDefaultSectionSize(44)
+    return tbl
+
+
 class Header(QFrame):
     def __init__(self):
         super().__init__()
@@ -296,61 +343,72 @@ class Header(QFrame):
         info_widget.setAttribute(Qt.WA_TranslucentBackground, True)
         info_layout = QHBoxLayout(info_widget)
         info_layout.setContentsMargins(0, 0, 0, 0)
-        info_layout.setSpacing(12)
+        info_layout.setSpacing(0)
 
         self.statusText = self._info_label("", 15)
         self.statusText.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        # Seconds get their own fixed-width label so the per-second tick only
+        # repaints two digits instead of relaying out the whole status line
+        self.secondsText = self._info_label("", 15)
+        self.secondsText.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.secondsText.setFixedWidth(self.secondsText.fontMetrics().horizontalAdvance("00"))
+        self._minute = None
 
         info_layout.addWidget(self.statusText, 0, Qt.AlignLeft)
+        info_layout.addWidget(self.secondsText, 0, Qt.AlignLeft)
         hl.addWidget(info_widget, 0, Qt.AlignLeft)
         hl.addStretch(1)
 
-        self.setStyleSheet(f"""
-        #Header {{
-            background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 {ORANGE}, stop:1 {ORANGE_DARK});
-            border-bottom: 2px solid {ORANGE_DARK};
-        }}
-        #Header QLabel {{
-            color: {LIGHT};
-        }}
-        """)
-
-        timer = QTimer(self)
-        timer.timeout.connect(self._tick)
-        timer.start(1000)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
         self._tick()
+        # Start ticking on the next second boundary so the display matches the clock
+        msec = QDateTime.currentDateTime().time().msec()
+        QTimer.singleShot(1000 - msec, self._start_ticking)
 
     def _divider(self):
         d = QFrame()
         d.setFrameShape(QFrame.VLine)
         d.setFrameShadow(QFrame.Plain)
         d.setLineWidth(1)
-        d.setStyleSheet("color: rgba(255, 255, 255, 0.4);")
+        d.setObjectName("HeaderDivider")
         return d
 
     def _logo_label(self, text, size, weight, italic=False):
         lbl = QLabel(text)
-        font = QFont("Segoe UI")
-        font.setPointSize(size)
-        font.setWeight(weight)
-        font.setItalic(italic)
-        font.setBold(weight >= QFont.Weight.Bold)
-        lbl.setFont(font)
+        lbl.setFont(_font(size, weight >= QFont.Weight.Bold, italic, weight))
         lbl.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         return lbl
 
     def _info_label(self, text, size, bold=False):
         lbl = QLabel(text)
-        font = QFont("Segoe UI")
-        font.setPointSize(size)
-        font.setBold(bold)
-        lbl.setFont(font)
+        lbl.setFont(_font(size, bold))
         lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         return lbl
 
+    def _start_ticking(self):
+        self._tick()
+        self._timer.start(1000)
+
     def _tick(self):
-        timestamp = QDateTime.currentDateTime().toString("dd/MM/yyyy hh:mm:ss")
-        self.statusText.setText(f"HI service    Mode: Auto    {timestamp}")
+        now = QDateTime.currentDateTime()
+        minute = now.toString("dd/MM/yyyy hh:mm")
+        if minute != self._minute:
+            self._minute = minute
+            self.statusText.setText(f"HI service    Mode: Auto    {minute}:")
+        self.secondsText.setText(f"{now.time().second():02d}")
+
+
+# Top bar navigation buttons: (attribute, icon, tooltip, page index)
+_TOP_BUTTONS = [
+    ("btnAlarm", icon_monitor, "Alarm History", 4),
+    ("btnUser", icon_user, "User", 0),
+    ("btnHome", icon_home, "Home", 0),
+    ("btnFetch", icon_fetch, "Fetch Tray", 1),
+    ("btnStorage", icon_storage, "Tray Overview", 2),
+    ("btnSettings", icon_settings, "Settings", 3),
+]
 
 
 class TopActionBar(QFrame):
@@ -358,19 +416,19 @@ class TopActionBar(QFrame):
         super().__init__()
         self.setObjectName("TopBar")
         self.setFixedHeight(112)
+        # Button icons are painted by the bar itself from one cached layer
+        # (see paintEvent); the buttons only provide hover and click regions
+        self._icons = []
+        self._iconLayer = None
         hl = QHBoxLayout(self)
         hl.setContentsMargins(28, 10, 28, 10)
         hl.setSpacing(18)
 
-        self.btnAlarm = self._icon_button(icon_monitor(), "Alarm History")
-        self.btnUser = self._icon_button(icon_user(), "User")
-        self.btnHome = self._icon_button(icon_home(), "Home")
-        self.btnFetch = self._icon_button(icon_fetch(), "Fetch Tray")
-        self.btnStorage = self._icon_button(icon_storage(), "Tray Overview")
-        self.btnSettings = self._icon_button(icon_settings(), "Settings")
-
-        for btn in [self.btnAlarm, self.btnUser, self.btnHome, self.btnFetch, self.btnStorage, self.btnSettings]:
+        for attr, icon_fn, tip, index in _TOP_BUTTONS:
+            btn = self._icon_button(icon_fn(), tip)
+            setattr(self, attr, btn)
             hl.addWidget(btn)
+            btn.clicked.connect(lambda _, i=index: on_nav(i))
 
         hl.addStretch(1)
 
@@ -396,54 +454,45 @@ class TopActionBar(QFrame):
         self.btnPower = self._icon_button(icon_power(), "Power")
         hl.addWidget(self.btnPower)
 
-        self.btnUser.clicked.connect(lambda: on_nav(0))
-        self.btnHome.clicked.connect(lambda: on_nav(0))
-        self.btnFetch.clicked.connect(lambda: on_nav(1))
-        self.btnStorage.clicked.connect(lambda: on_nav(2))
-        self.btnSettings.clicked.connect(lambda: on_nav(3))
-        self.btnAlarm.clicked.connect(lambda: on_nav(4))
-        self.btnPower.clicked.connect(lambda: QApplication.instance().quit() if QApplication.instance() else None)
-
-        self.setStyleSheet(f"""
-        #TopBar {{
-            background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 {ORANGE}, stop:1 {ORANGE_DARK});
-            border-bottom: 2px solid {ORANGE_DARK};
-        }}
-        #TopBar QToolButton {{
-            border: none;
-            border-radius: 12px;
-            background: rgba(255, 255, 255, 0.18);
-            padding: 10px;
-        }}
-        #TopBar QToolButton::hover {{
-            background: rgba(255, 255, 255, 0.32);
-        }}
-        #TopBar QLabel#StatusPill {{
-            background: rgba(255, 255, 255, 0.92);
-            color: {ORANGE_DARK};
-            border-radius: 18px;
-            font-weight: 600;
-            padding: 10px 18px;
-        }}
-        #TopBar QLabel#IndicatorChip {{
-            background: #25b66a;
-            color: white;
-            border-radius: 6px;
-            font-weight: 600;
-        }}
-        """)
+        self.btnPower.clicked.connect(QApplication.quit)
 
     def _icon_button(self, icon, tooltip):
         btn = QToolButton()
         btn.setCursor(Qt.PointingHandCursor)
-        btn.setIcon(icon)
         btn.setIconSize(QSize(54, 54))
+        self._icons.append((btn, icon))
         btn.setFixedSize(72, 72)
         btn.setToolButtonStyle(Qt.ToolButtonIconOnly)
         btn.setAutoRaise(False)
         btn.setToolTip(tooltip)
         return btn
 
+    def resizeEvent(self, event):
+        self._iconLayer = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        dpr = self.devicePixelRatioF()
+        if self._iconLayer is None or self._iconLayer.devicePixelRatio() != dpr:
+            self._iconLayer = self._render_icon_layer(dpr)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._iconLayer)
+        painter.end()
+
+    def _render_icon_layer(self, dpr):
+        """Paint every button icon, at its button's position, into one transparent pixmap."""
+        pm = QPixmap(self.size() * dpr)
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.transparent)
+        painter = QPainter(pm)
+        for btn, icon in self._icons:
+            rect = QRectF(0, 0, btn.iconSize().width(), btn.iconSize().height())
+            rect.moveCenter(QRectF(btn.geometry()).center())
+            icon.paint(painter, rect.toRect())
+        painter.end()
+        return pm
+
 
 class HomePage(QWidget):
     def __init__(self):
@@ -523,17 +572,7 @@ class HomePage(QWidget):
         tiles_row = QHBoxLayout()
         tiles_row.setSpacing(14)
         self.tiles = {}
-        tiles = [
-            ("Tray Data", "#d16436"),
-            ("Inventory List", "#3b7bdc"),
-            ("Material Tracking", "#d6688f"),
-            ("Available Space", "#2db16b"),
-            ("Call Tray Details", "#1aa196"),
-            ("Machine Status", "#a58a3a"),
-            ("Tray Configuration", "#d8a540"),
-            ("Tray Partition", "#1a3f8f"),
-        ]
-        for text, color in tiles:
+        for text, color in HOME_TILES:
             btn = tile_button(text, color)
             self.tiles[text] = btn
             tiles_row.addWidget(btn)
@@ -552,8 +591,8 @@ class MachineStatusPage(QWidget):
         legend = QHBoxLayout()
         on_lbl = label("ON", bold=True, color=LIGHT)
         off_lbl = label("OFF", bold=True, color=LIGHT)
-        on_chip = QFrame(); on_chip.setStyleSheet(f"background:{GREEN}; border-radius:6px;"); on_chip.setFixedSize(48,18)
-        off_chip = QFrame(); off_chip.setStyleSheet(f"background:{RED}; border-radius:6px;"); off_chip.setFixedSize(48,18)
+        on_chip = QFrame(); on_chip.setObjectName("LegendOn"); on_chip.setFixedSize(48,18)
+        off_chip = QFrame(); off_chip.setObjectName("LegendOff"); off_chip.setFixedSize(48,18)
         legend.addWidget(on_chip); legend.addWidget(on_lbl); legend.addSpacing(16)
         legend.addWidget(off_chip); legend.addWidget(off_lbl); legend.addStretch(1)
         legw = QFrame(); ll = QHBoxLayout(legw); ll.addLayout(legend)
@@ -564,13 +603,12 @@ class MachineStatusPage(QWidget):
 
         def status_group(title, rows):
             g = QGroupBox(title)
-            g.setStyleSheet("QGroupBox{font-weight:600;}")
             v = QVBoxLayout(g)
             lst = QListWidget()
             for r in rows:
                 it = QListWidgetItem(r)
-                it.setBackground(QBrush(QColor(GREEN)))
-                it.setForeground(QBrush(Qt.white))
+                it.setBackground(_brush(GREEN))
+                it.setForeground(_brush(Qt.white))
                 lst.addItem(it)
             lst.setFrameShape(QFrame.NoFrame)
             lst.setSpacing(4)
@@ -613,25 +651,16 @@ class ModelTrayConfigPage(QWidget):
         filters.addStretch(1)
         v.addLayout(filters)
 
-        self.table = QTableWidget(6, 8)
-        self.table.setHorizontalHeaderLabels([
-            "Site", "Tray No", "Model", "Row Number", "Column No", "Update", "Delete", "⭳"
-        ])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.horizontalHeader().setFixedHeight(46)
-        self.table.verticalHeader().setDefaultSectionSize(44)
-        for r in range(self.table.rowCount()):
-            self.table.setItem(r, 0, QTableWidgetItem(str(r+1)))
-            self.table.setItem(r, 1, QTableWidgetItem(str(100+r)))
-            self.table.setItem(r, 2, QTableWidgetItem("XT2_39_BB"))
-            self.table.setItem(r, 3, QTableWidgetItem("5"))
-            self.table.setItem(r, 4, QTableWidgetItem("24"))
-            u = orange_button("Update")
-            d = gray_button("Del")
-            e = gray_button("View")
-            self.table.setCellWidget(r, 5, u)
-            self.table.setCellWidget(r, 6, d)
-            self.table.setCellWidget(r, 7, e)
+        rows = [(str(r+1), str(100+r), "XT2_39_BB", "5", "24", "Update", "Del", "View")
+                for r in range(6)]
+        self.table = data_table(
+            ["Site", "Tray No", "Model", "Row Number", "Column No", "Update", "Delete", "⭳"], rows
+        )
+        self.updateButtons = ButtonDelegate(accent=True, parent=self.table)
+        self.rowButtons = ButtonDelegate(parent=self.table)
+        self.table.setItemDelegateForColumn(5, self.updateButtons)
+        self.table.setItemDelegateForColumn(6, self.rowButtons)
+        self.table.setItemDelegateForColumn(7, self.rowButtons)
 
         v.addWidget(self.table, 1)
 
@@ -662,15 +691,8 @@ class MaterialIOSearchPage(QWidget):
         row.addWidget(gray_button("Clear"))
         v.addLayout(row)
 
-        tbl = QTableWidget(8, 8)
-        tbl.setHorizontalHeaderLabels(["S No", "Date", "Time", "Tray No", "Child Part",
-                                       "Product Code", "Serial No", "Qty"])
-        tbl.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        tbl.horizontalHeader().setFixedHeight(46)
-        tbl.verticalHeader().setDefaultSectionSize(44)
-        for r in range(8):
-            for c in range(8):
-                tbl.setItem(r, c, QTableWidgetItem("-"))
+        tbl = data_table(["S No", "Date", "Time", "Tray No", "Child Part",
+                          "Product Code", "Serial No", "Qty"], [("-",) * 8] * 8)
         v.addWidget(tbl, 1)
 
         footer = QHBoxLayout()
@@ -729,14 +751,8 @@ class CallTrayHistoryPage(QWidget):
         filt.addWidget(gray_button("Clear"))
         v.addLayout(filt)
 
-        tbl = QTableWidget(7, 8)
-        tbl.setHorizontalHeaderLabels(["S No", "Date", "Time", "Tray No", "Slots", "Storage Side", "User", "Access Point"])
-        tbl.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        tbl.horizontalHeader().setFixedHeight(46)
-        tbl.verticalHeader().setDefaultSectionSize(44)
-        for r in range(7):
-            for c in range(8):
-                tbl.setItem(r, c, QTableWidgetItem(""))
+        tbl = data_table(["S No", "Date", "Time", "Tray No", "Slots", "Storage Side", "User", "Access Point"],
+                         [("",) * 8] * 7)
         v.addWidget(tbl, 1)
 
         foot = QHBoxLayout()
@@ -767,17 +783,19 @@ class MainWindow(QMainWindow):
         self.pages = QStackedWidget()
         self.pages.setObjectName("PageStack")
         self.homePage = HomePage()
-        self.modelPage = ModelTrayConfigPage()
-        self.ioPage = MaterialIOSearchPage()
-        self.partitionPage = TrayPartitionPage()
-        self.historyPage = CallTrayHistoryPage()
-        self.statusPage = MachineStatusPage()
         self.pages.addWidget(self.homePage)        # 0
-        self.pages.addWidget(self.modelPage)       # 1
-        self.pages.addWidget(self.ioPage)          # 2
-        self.pages.addWidget(self.partitionPage)   # 3
-        self.pages.addWidget(self.historyPage)     # 4
-        self.pages.addWidget(self.statusPage)      # 5
+        # The other pages are built on first visit (see _navigate_to); empty
+        # placeholders keep their stack indices stable until then
+        self._page_factories = {
+            1: ModelTrayConfigPage,
+            2: MaterialIOSearchPage,
+            3: TrayPartitionPage,
+            4: CallTrayHistoryPage,
+            5: MachineStatusPage,
+        }
+        self._pages_built = {0: self.homePage}
+        for _ in self._page_factories:
+            self.pages.addWidget(QWidget())
 
         contentFrame = QFrame()
         contentFrame.setObjectName("ContentFrame")
@@ -790,110 +808,6 @@ class MainWindow(QMainWindow):
         self._wire_home_tiles()
         self._navigate_to(0)
 
-        self.setStyleSheet(f"""
-        QWidget {{
-            background: {GRAY_BG};
-            color: {DARK};
-            font-family: 'Segoe UI', 'Noto Sans', 'Ubuntu', Arial;
-            font-size: 12px;
-        }}
-        #LeftLegend {{
-            background: #e7e9ec;
-            border-radius: 6px;
-        }}
-        #ContentFrame {{
-            background: {LIGHT};
-            border: 1px solid #e5e7eb;
-            border-radius: 18px;
-        }}
-        #HomeCard {{
-            background: #f7f8fb;
-            border: 1px solid #e4e7ec;
-            border-radius: 18px;
-        }}
-        #HomeStatusBanner {{
-            background: #fbe8d9;
-            color: {ORANGE_DARK};
-            border-radius: 12px;
-            font-weight: 600;
-            letter-spacing: 0.6px;
-        }}
-        QPushButton#HelpButton {{
-            background: #f1f1f1;
-            border: 1px solid #d1d5db;
-            border-radius: 18px;
-            font-weight: 700;
-            color: {ORANGE_DARK};
-        }}
-        QPushButton#HelpButton:hover {{
-            background: #e6e7ea;
-        }}
-        QSpinBox#TrayNumberInput {{
-            background: #edf5ff;
-            border: 1px solid #9cbcf5;
-            border-radius: 10px;
-            padding: 6px 12px;
-            font-weight: 600;
-            color: #1d4ed8;
-        }}
-        #PageStack {{
-            background: transparent;
-        }}
-        QTableWidget {{
-            background: {LIGHT};
-            border: 1px solid #e5e7eb;
-            gridline-color: #e5e7eb;
-            selection-background-color: {ORANGE};
-            selection-color: white;
-            border-radius: 12px;
-        }}
-        QHeaderView::section {{
-            background: #f5f6f8;
-            color: {DARK};
-            border: 1px solid #dcdfe3;
-            padding: 10px 8px;
-            font-weight: 600;
-        }}
-        QPushButton {{
-            background: #e5e7eb;
-            border: 1px solid #d1d5db;
-            border-radius: 8px;
-            padding: 8px 12px;
-        }}
-        QPushButton:hover {{ background: #e9ecef; }}
-        QPushButton[accent="true"] {{
-            background: {ORANGE};
-            border-color: {ORANGE_DARK};
-            color: {LIGHT};
-            font-weight: 600;
-        }}
-        QPushButton[accent="true"]:hover {{
-            background: {ORANGE_DARK};
-        }}
-        QLineEdit, QSpinBox, QComboBox {{
-            background: {LIGHT};
-            border: 1px solid #d1d5db;
-            border-radius: 6px;
-            padding: 6px 8px;
-        }}
-        QGroupBox {{
-            background: {LIGHT};
-            border: 1px solid #e5e7eb;
-            border-radius: 10px;
-            margin-top: 12px;
-            padding: 8px;
-        }}
-        QListWidget {{
-            background: transparent;
-            border: none;
-        }}
-        QListWidget::item {{
-            margin: 4px 0;
-            padding: 6px 8px;
-            border-radius: 6px;
-        }}
-        """)
-
         self._setup_tray()
 
     def _wire_home_tiles(self):
@@ -912,8 +826,16 @@ class MainWindow(QMainWindow):
                 btn.clicked.connect(lambda _, i=index: self._navigate_to(i))
 
     def _navigate_to(self, index: int):
-        if 0 <= index < self.pages.count():
-            self.pages.setCurrentIndex(index)
+        if not 0 <= index < self.pages.count():
+            return
+        if index not in self._pages_built:
+            page = self._page_factories[index]()
+            self._pages_built[index] = page
+            placeholder = self.pages.widget(index)
+            self.pages.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.pages.insertWidget(index, page)
+        self.pages.setCurrentIndex(index)
 
     def _setup_tray(self):
         self.tray = QSystemTrayIcon(self)
@@ -932,12 +854,12 @@ class MainWindow(QMainWindow):
         act_hide = QAction("Hide Window", self, triggered=self.hide)
         act_quit = QAction("Quit", self, triggered=QApplication.instance().quit)
 
-        act_traycfg = QAction("Model Tray Configuration", self, triggered=lambda: self.pages.setCurrentIndex(1))
+        act_traycfg = QAction("Model Tray Configuration", self, triggered=lambda: self._navigate_to(1))
 
         nav = QMenu("Navigate", menu)
 
         def add_nav(title, idx):
-            action = QAction(title, self, triggered=lambda i=idx: self.pages.setCurrentIndex(i))
+            action = QAction(title, self, triggered=lambda i=idx: self._navigate_to(i))
             nav.addAction(action)
 
         add_nav("Status", 0)
@@ -958,8 +880,171 @@ class MainWindow(QMainWindow):
         self.tray.show()
 
 
+# One application-wide stylesheet, parsed once in main() instead of per widget
+APP_QSS = f"""
+    QWidget {{
+        background: {GRAY_BG};
+        color: {DARK};
+        font-family: 'Segoe UI', 'Noto Sans', 'Ubuntu', Arial;
+        font-size: 12px;
+    }}
+    #LeftLegend {{
+        background: #e7e9ec;
+        border-radius: 6px;
+    }}
+    #ContentFrame {{
+        background: {LIGHT};
+        border: 1px solid #e5e7eb;
+        border-radius: 18px;
+    }}
+    #HomeCard {{
+        background: #f7f8fb;
+        border: 1px solid #e4e7ec;
+        border-radius: 18px;
+    }}
+    #HomeStatusBanner {{
+        background: #fbe8d9;
+        color: {ORANGE_DARK};
+        border-radius: 12px;
+        font-weight: 600;
+        letter-spacing: 0.6px;
+    }}
+    QPushButton#HelpButton {{
+        background: #f1f1f1;
+        border: 1px solid #d1d5db;
+        border-radius: 18px;
+        font-weight: 700;
+        color: {ORANGE_DARK};
+    }}
+    QPushButton#HelpButton:hover {{
+        background: #e6e7ea;
+    }}
+    QSpinBox#TrayNumberInput {{
+        background: #edf5ff;
+        border: 1px solid #9cbcf5;
+        border-radius: 10px;
+        padding: 6px 12px;
+        font-weight: 600;
+        color: #1d4ed8;
+    }}
+    #PageStack {{
+        background: transparent;
+    }}
+    QTableView {{
+        background: {LIGHT};
+        border: 1px solid #e5e7eb;
+        gridline-color: #e5e7eb;
+        selection-background-color: {ORANGE};
+        selection-color: white;
+        border-radius: 12px;
+    }}
+    QHeaderView::section {{
+        background: #f5f6f8;
+        color: {DARK};
+        border: 1px solid #dcdfe3;
+        padding: 10px 8px;
+        font-weight: 600;
+    }}
+    QPushButton {{
+        background: #e5e7eb;
+        border: 1px solid #d1d5db;
+        border-radius: 8px;
+        padding: 8px 12px;
+    }}
+    QPushButton:hover {{ background: #e9ecef; }}
+    QPushButton[accent="true"] {{
+        background: {ORANGE};
+        border-color: {ORANGE_DARK};
+        color: {LIGHT};
+        font-weight: 600;
+    }}
+    QPushButton[accent="true"]:hover {{
+        background: {ORANGE_DARK};
+    }}
+    QLineEdit, QSpinBox, QComboBox {{
+        background: {LIGHT};
+        border: 1px solid #d1d5db;
+        border-radius: 6px;
+        padding: 6px 8px;
+    }}
+    QGroupBox {{
+        background: {LIGHT};
+        border: 1px solid #e5e7eb;
+        border-radius: 10px;
+        margin-top: 12px;
+        padding: 8px;
+        font-weight: 600;
+    }}
+    QListWidget {{
+        background: transparent;
+        border: none;
+    }}
+    QListWidget::item {{
+        margin: 4px 0;
+        padding: 6px 8px;
+        border-radius: 6px;
+    }}
+    #Header {{
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 {ORANGE}, stop:1 {ORANGE_DARK});
+        border-bottom: 2px solid {ORANGE_DARK};
+    }}
+    #Header QLabel {{
+        color: {LIGHT};
+    }}
+    #Header QFrame#HeaderDivider {{
+        color: rgba(255, 255, 255, 0.4);
+    }}
+    #TopBar {{
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 {ORANGE}, stop:1 {ORANGE_DARK});
+        border-bottom: 2px solid {ORANGE_DARK};
+    }}
+    #TopBar QToolButton {{
+        border: none;
+        border-radius: 12px;
+        background: rgba(255, 255, 255, 0.18);
+        padding: 10px;
+    }}
+    #TopBar QToolButton::hover {{
+        background: rgba(255, 255, 255, 0.32);
+    }}
+    #TopBar QLabel#StatusPill {{
+        background: rgba(255, 255, 255, 0.92);
+        color: {ORANGE_DARK};
+        border-radius: 18px;
+        font-weight: 600;
+        padding: 10px 18px;
+    }}
+    #TopBar QLabel#IndicatorChip {{
+        background: #25b66a;
+        color: white;
+        border-radius: 6px;
+        font-weight: 600;
+    }}
+    QPushButton#HomeTile {{
+        color: white;
+        border: none;
+        border-radius: 14px;
+        padding: 18px 16px;
+        font-weight: 600;
+        font-size: 14px;
+    }}
+    QFrame#LegendOn {{
+        background: {GREEN};
+        border-radius: 6px;
+    }}
+    QFrame#LegendOff {{
+        background: {RED};
+        border-radius: 6px;
+    }}
+""" + "".join(
+    f'QPushButton#HomeTile[tileColor="{color}"] {{ background: {color}; }}\n'
+    for _, color in HOME_TILES
+)
+
+
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_QSS)
     w = MainWindow()
     w.show()
     sys.exit(app.exec())
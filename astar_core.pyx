@@ -0,0 +1,140 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -march=native
+# ============================================================================
+# A* SEARCH CORE - OPTIONAL CYTHON BUILD
+# ============================================================================
+# Same search as _astar_kernel in A_star.py, with every local typed as a C int
+# and all buffers malloc'd. A_star.py uses it automatically once built:
+#
+#     cythonize -i astar_core.pyx
+
+from libc.stdlib cimport malloc, free
+
+cdef enum:
+    OBSTACLE = 88  # ord('X')
+
+# Largest padded grid whose packed heap keys fit in a 64-bit int
+MAX_CELLS = 1000000
+
+
+cdef inline void heap_push(long long* heap, int* size, long long key) noexcept nogil:
+    """Push key onto a binary min-heap of packed keys"""
+    cdef int i = size[0]
+    cdef int parent
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap[parent] <= key:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = key
+    size[0] += 1
+
+
+cdef inline void heap_pop(long long* heap, int* size) noexcept nogil:
+    """Remove the root of the heap (caller reads it first)"""
+    size[0] -= 1
+    cdef int n = size[0]
+    cdef long long key = heap[n]
+    cdef int i = 0
+    cdef int child
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[child] >= key:
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = key
+
+
+cpdef list astar(const unsigned char[:, ::1] grid, int sr, int sc, int gr, int gc):
+    """
+    Find shortest path from (sr, sc) to (gr, gc) on a uint8 grid of cell bytes
+
+    Returns: path (list of (row, col)) or None if no path exists
+    """
+    cdef int rows = grid.shape[0]
+    cdef int cols = grid.shape[1]
+    cdef int pcols = cols + 2
+    cdef int n = (rows + 2) * pcols
+    if n > MAX_CELLS:
+        raise ValueError(f"grid too large for the compiled core ({rows}x{cols})")
+
+    cdef unsigned char* cells = <unsigned char*>malloc(n)
+    cdef int* g = <int*>malloc(n * sizeof(int))
+    cdef int* parent = <int*>malloc(n * sizeof(int))
+    cdef long long* heap = <long long*>malloc((4 * n + 1) * sizeof(long long))
+    if not cells or not g or not parent or not heap:
+        free(cells); free(g); free(parent); free(heap)
+        raise MemoryError()
+
+    cdef int r, c, k, i, current, neighbor, new_cost, h, size = 0
+    cdef int start = (sr + 1) * pcols + sc + 1
+    cdef int goal = (gr + 1) * pcols + gc + 1
+    cdef int offsets[4]
+    cdef int drs[4]
+    cdef int dcs[4]
+    cdef bint found = False
+    cdef list path = None
+
+    # Neighbour offsets (up, down, left, right) in the padded grid
+    offsets[0] = -pcols; offsets[1] = pcols; offsets[2] = -1; offsets[3] = 1
+    drs[0] = -1; drs[1] = 1; drs[2] = 0; drs[3] = 0
+    dcs[0] = 0; dcs[1] = 0; dcs[2] = -1; dcs[3] = 1
+
+    try:
+        with nogil:
+            # Copy the grid inside a one-cell obstacle border
+            for i in range(n):
+                cells[i] = OBSTACLE
+                g[i] = 0x7FFFFFFF
+                parent[i] = -1
+            for r in range(rows):
+                for c in range(cols):
+                    cells[(r + 1) * pcols + c + 1] = grid[r, c]
+
+            # Keys pack (priority, n - cost, index) as in _astar_kernel; a cell
+            # is closed once popped, marked by flipping its g to negative
+            g[start] = 0
+            heap_push(heap, &size, ((<long long>(abs(sr - gr) + abs(sc - gc))) * n + n) * n + start)
+
+            while size > 0:
+                current = <int>(heap[0] % n)
+                heap_pop(heap, &size)
+                if g[current] < 0:
+                    continue
+                if current == goal:
+                    found = True
+                    break
+                new_cost = g[current] + 1
+                g[current] = -new_cost
+
+                r = current // pcols
+                c = current - r * pcols
+                for k in range(4):
+                    neighbor = current + offsets[k]
+                    if cells[neighbor] == OBSTACLE or g[neighbor] < 0 or new_cost >= g[neighbor]:
+                        continue
+                    g[neighbor] = new_cost
+                    parent[neighbor] = current
+
+                    h = abs(r + drs[k] - 1 - gr) + abs(c + dcs[k] - 1 - gc)
+                    heap_push(heap, &size, ((<long long>(new_cost + h)) * n + n - new_cost) * n + neighbor)
+
+        if found:
+            path = [(gr, gc)]
+            current = goal
+            while current != start:
+                current = parent[current]
+                path.append((current // pcols - 1, current % pcols - 1))
+            path.reverse()
+        return path
+    finally:
+        free(cells)
+        free(g)
+        free(parent)
+        free(heap)
@@ -11,7 +11,8 @@ from PySide6.QtGui import QColor
 # ============================================================================
 
 DATABASE = "asrs_business.db"
-SAVE_FILE = "asrs_business_state.json"
+SAVE_FILE = "asrs_business_state.db"  # Snapshot of DATABASE written by Save
+LEGACY_SAVE_FILE = "asrs_business_state.json"  # Rack layout saved by older versions
 
 GRID_ROWS = 30
 GRID_COLS = 25
@@ -4,11 +4,26 @@ ASRS WAREHOUSE MANAGEMENT SYSTEM - CORE CLASSES
 ============================================================================
 """
 
-from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
 from config import MODEL_ZONES
 
+EMPTY = -1  # Rack.grid value of a cell with no box
+
+@lru_cache(maxsize=None)
+def _corner_distances(r0, r1, ncols, origin_row, origin_col):
+    """Manhattan distance from the origin to corners in rows r0..r1-1, cols 0..ncols-1"""
+    distance = np.add.outer(np.abs(np.arange(r0, r1) - origin_row),
+                            np.abs(np.arange(ncols) - origin_col))
+    distance.flags.writeable = False  # Shared between calls
+    return distance
+
 class Box:
     """Box/Item model"""
+    __slots__ = ('box_id', 'model_id', 'length', 'width', 'sku', 'description')
+    
     def __init__(self, model_id, length, width, box_id=None, sku=None, description=None):
         self.box_id = box_id
         self.model_id = model_id
@@ -19,27 +34,97 @@ class Box:
 
 class Rack:
     """Enhanced Rack system"""
+    __slots__ = ('rows', 'cols', 'grid', 'occ', '_row_zone', '_occupied_cells',
+                 '_box_ids', '_box_rows', '_box_cols', '_box_sizes', '_box_count', '_box_index',
+                 '_locations', 'dirty_cells')
+    
     def __init__(self, rows, cols):
         self.rows = rows
         self.cols = cols
-        self.grid = [[None for _ in range(cols)] for _ in range(rows)]
-        self.box_locations = {}
+        self.grid = np.full((rows, cols), EMPTY, dtype=np.int32)  # Box id per cell
+        self.occ = np.zeros((rows, cols), dtype=np.uint8)  # 1 = occupied, mirrors grid
+        # Zone (model size) that owns each row, 0 = no zone
+        self._row_zone = np.zeros(rows, dtype=np.int8)
+        for size, zone in MODEL_ZONES.items():
+            self._row_zone[zone['range'][0]:zone['range'][1] + 1] = size
+        self._occupied_cells = 0
+        # Stored boxes as parallel arrays (one slot per box, packed at the
+        # front); every box covers a cell, so rows * cols slots are always
+        # enough. box_id -> slot is a dense array (-1 = not stored) grown by
+        # doubling on demand.
+        # Its length is bounded by the largest box id placed on this Rack, not
+        # by rows * cols: boxes.box_id is AUTOINCREMENT and never reused, so
+        # within a session it grows with store operations (4 bytes per id,
+        # about 4 MB per million). A fresh Rack restarts from the largest
+        # id still stored, and a warehouse reset restarts ids from 1
+        capacity = rows * cols
+        self._box_ids = np.zeros(capacity, dtype=np.int64)
+        self._box_rows = np.zeros(capacity, dtype=np.int16)
+        self._box_cols = np.zeros(capacity, dtype=np.int16)
+        self._box_sizes = np.zeros(capacity, dtype=np.int16)
+        self._box_count = 0
+        self._box_index = np.full(capacity, -1, dtype=np.int32)
+        self._locations = None  # box_locations dict, rebuilt after changes
+        self.dirty_cells = set()  # (row, col) changed since the UI last drew them
+    
+    @property
+    def box_locations(self):
+        """{box_id: (row, col, size)} for every stored box"""
+        if self._locations is None:
+            n = self._box_count
+            self._locations = {
+                box_id: (row, col, size)
+                for box_id, row, col, size in zip(self._box_ids[:n].tolist(), self._box_rows[:n].tolist(),
+                                                  self._box_cols[:n].tolist(), self._box_sizes[:n].tolist())
+            }
+        return self._locations
+    
+    def locate(self, box_id):
+        """(row, col, size) of a stored box, or None if it is not on the rack"""
+        if not 0 <= box_id < len(self._box_index):
+            return None
+        i = self._box_index[box_id]
+        if i < 0:
+            return None
+        return int(self._box_rows[i]), int(self._box_cols[i]), int(self._box_sizes[i])
+    
+    def boxes_of_size(self, size):
+        """Ids of all stored boxes of the given size"""
+        n = self._box_count
+        return self._box_ids[:n][self._box_sizes[:n] == size]
         
     def find_nearest_empty_slot(self, model_size, origin_row, origin_col):
-        """Find nearest empty slot within the designated zone using BFS."""
+        """Find the empty slot nearest to the origin within the designated zone."""
         if model_size not in MODEL_ZONES:
             return None # No zone defined for this model size
 
         zone_info = MODEL_ZONES[model_size]
         start_row, end_row = zone_info['range']
+        
+        # The whole box must stay inside its zone and the grid
+        last_row = min(end_row, self.rows - 1) - model_size + 1
+        last_col = self.cols - model_size
+        if last_row < start_row or last_col < 0:
+            return None
 
-        # Iterate through the zone to find the first available slot
-        for r in range(start_row, end_row + 1):
-            for c in range(self.cols):
-                if self._can_fit(r, c, model_size):
-                    return (r, c)
+        # Summed-area table with a zero border: the occupied count of any
+        # size x size window is then four corner lookups
+        sat = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int32)
+        sat[1:, 1:] = self.occ.cumsum(0).cumsum(1)
+        s = model_size
+        r0, r1 = start_row, last_row + 1
+        windows = (sat[r0 + s:r1 + s, s:last_col + 1 + s] - sat[r0:r1, s:last_col + 1 + s]
+                   - sat[r0 + s:r1 + s, :last_col + 1] + sat[r0:r1, :last_col + 1])
         
-        return None
+        free = windows == 0
+        if not free.any():
+            return None
+        
+        # Nearest free top-left corner by Manhattan distance (row-major on ties)
+        distance = _corner_distances(r0, r1, last_col + 1, origin_row, origin_col)
+        distance = np.where(free, distance, np.iinfo(distance.dtype).max)
+        r, c = divmod(int(distance.argmin()), last_col + 1)
+        return (r0 + r, c)
     
     def _can_fit(self, row, col, size):
         """Check if box can fit at position"""
@@ -48,50 +133,89 @@ class Rack:
             return False
         
         # Check if the box stays within its designated zone
-        for r_check in range(row, row + size):
-            found_zone = False
-            for zone in MODEL_ZONES.values():
-                if zone['range'][0] <= r_check <= zone['range'][1]:
-                    # This part of the box is in a valid zone.
-                    # Now, ensure it's the *correct* zone for this size.
-                    if MODEL_ZONES[size]['range'][0] <= r_check <= MODEL_ZONES[size]['range'][1]:
-                        found_zone = True
-                        break
-            if not found_zone:
-                return False # Part of the box is outside its designated zone
+        if not (self._row_zone[row:row + size] == size).all():
+            return False # Part of the box is outside its designated zone
 
         # Check if the area is occupied
-        for r in range(row, row + size):
-            for c in range(col, col + size):
-                if self.grid[r][c] is not None:
-                    return False
-        return True
+        return not self.occ[row:row + size, col:col + size].any()
     
     def place_box(self, box_id, row, col, size):
         """Place box on rack"""
-        for r in range(row, row + size):
-            for c in range(col, col + size):
-                self.grid[r][c] = box_id
-        self.box_locations[box_id] = (row, col, size)
+        self.grid[row:row + size, col:col + size] = box_id
+        self.occ[row:row + size, col:col + size] = 1
+        self.dirty_cells.update((r, c) for r in range(row, row + size) for c in range(col, col + size))
+        if box_id >= len(self._box_index):
+            grown = np.full(max(box_id + 1, 2 * len(self._box_index)), -1, dtype=np.int32)
+            grown[:len(self._box_index)] = self._box_index
+            self._box_index = grown
+        i = self._box_index[box_id]
+        if i < 0:
+            i = self._box_count
+            self._box_index[box_id] = i
+            self._box_count += 1
+        self._box_ids[i] = box_id
+        self._box_rows[i] = row
+        self._box_cols[i] = col
+        self._box_sizes[i] = size
+        self._locations = None
+        self._occupied_cells += size * size
+    
+    def load_boxes(self, positions):
+        """Place (box_id, row, col, size) rows on an empty rack in one pass"""
+        positions = np.array(positions, dtype=np.int64).reshape(-1, 4)
+        n = len(positions)
+        if not n:
+            return
+        ids, rows, cols, sizes = positions.T
+        
+        if ids.max() >= len(self._box_index):
+            grown = np.full(max(int(ids.max()) + 1, 2 * len(self._box_index)), -1, dtype=np.int32)
+            grown[:len(self._box_index)] = self._box_index
+            self._box_index = grown
+        self._box_index[ids] = np.arange(n)
+        self._box_ids[:n] = ids
+        self._box_rows[:n] = rows
+        self._box_cols[:n] = cols
+        self._box_sizes[:n] = sizes
+        self._box_count = n
+        self._locations = None
+        
+        # Fill each box's cells, one offset of each box size at a time
+        for size in np.unique(sizes).tolist():
+            mask = sizes == size
+            for dr in range(size):
+                for dc in range(size):
+                    self.grid[rows[mask] + dr, cols[mask] + dc] = ids[mask]
+        self.occ[:] = self.grid != EMPTY
+        self._occupied_cells = int((sizes * sizes).sum())
+        occupied_rows, occupied_cols = np.nonzero(self.occ)
+        self.dirty_cells.update(zip(occupied_rows.tolist(), occupied_cols.tolist()))
     
     def remove_box(self, box_id):
         """Remove box from rack"""
-        if box_id not in self.box_locations:
+        if not 0 <= box_id < len(self._box_index) or self._box_index[box_id] < 0:
             return False
+        i = int(self._box_index[box_id])
+        self._box_index[box_id] = -1
         
-        row, col, size = self.box_locations[box_id]
-        for r in range(row, row + size):
-            for c in range(col, col + size):
-                self.grid[r][c] = None
+        row = int(self._box_rows[i])
+        col = int(self._box_cols[i])
+        size = int(self._box_sizes[i])
+        self.grid[row:row + size, col:col + size] = EMPTY
+        self.occ[row:row + size, col:col + size] = 0
+        self.dirty_cells.update((r, c) for r in range(row, row + size) for c in range(col, col + size))
+        self._occupied_cells -= size * size
         
-        del self.box_locations[box_id]
+        # Keep the arrays packed by moving the last box into the freed slot
+        last = self._box_count - 1
+        if i != last:
+            for arr in (self._box_ids, self._box_rows, self._box_cols, self._box_sizes):
+                arr[i] = arr[last]
+            self._box_index[self._box_ids[i]] = i
+        self._box_count = last
+        self._locations = None
         return True
     
     def get_occupied_cells(self):
         """Count occupied cells"""
-        count = 0
-        for row in self.grid:
-            for cell in row:
-                if cell is not None:
-                    count += 1
-        return count
+        return self._occupied_cells
@@ -4,15 +4,68 @@ ASRS WAREHOUSE MANAGEMENT SYSTEM - DATABASE FUNCTIONS
 ============================================================================
 """
 
+import os
 import sqlite3
 import csv
+import time
+from datetime import datetime, timedelta, timezone
 from config import DATABASE
 
+_connection = None
+
+# get_analytics_data results by days, as (fetch time, data)
+_analytics_cache = {}
+ANALYTICS_TTL = 10  # seconds
+
+# Operations waiting to be written by flush_operation_log
+_log_buffer = []
+LOG_BUFFER_SIZE = 100
+
+CSV_BUFFER_SIZE = 1 << 20  # export_to_csv file buffer, in bytes
+
+# Running counters behind get_live_stats: loaded from SQL once, then kept
+# current by log_operation
+_live_stats = None
+
+# Stored in PRAGMA user_version once init_database has built the schema;
+# bump it whenever the DDL below changes so existing files are upgraded
+SCHEMA_VERSION = 1
+
+def get_conn():
+    """Shared connection, opened on first use in WAL mode with tuned pragmas"""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(DATABASE, cached_statements=256)
+        _connection.execute('PRAGMA journal_mode=WAL')
+        _connection.execute('PRAGMA synchronous=NORMAL')
+        _connection.execute('PRAGMA temp_store=MEMORY')
+        _connection.execute('PRAGMA mmap_size=268435456')
+        _connection.execute('PRAGMA cache_size=-65536')
+    return _connection
+
+def close_conn():
+    """Close the shared connection (e.g. before the database file is deleted)"""
+    global _connection
+    if _connection is not None:
+        flush_operation_log()
+        _connection.execute('PRAGMA optimize')  # Refresh planner statistics where they are stale
+        _connection.close()
+        _connection = None
+    _analytics_cache.clear()
+    _reset_live_stats()
+
 def init_database():
     """Initialize enhanced database"""
-    conn = sqlite3.connect(DATABASE)
+    conn = get_conn()
     cursor = conn.cursor()
     
+    if cursor.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+        return  # Schema already current
+    
+    # sqlite3 runs DDL in autocommit mode; one explicit transaction makes
+    # the whole setup a single commit
+    cursor.execute('BEGIN')
+    
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS box_models (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -35,10 +88,18 @@ def init_database():
             retrieval_date TIMESTAMP,
             level INTEGER,
             status TEXT DEFAULT 'stored',
+            rack_row INTEGER,
+            rack_col INTEGER,
             FOREIGN KEY (model_id) REFERENCES box_models(id)
         )
     ''')
     
+    # Rack positions were added later - extend older databases in place
+    box_columns = {row[1] for row in cursor.execute('PRAGMA table_info(boxes)')}
+    for column in ('rack_row', 'rack_col'):
+        if column not in box_columns:
+            cursor.execute(f'ALTER TABLE boxes ADD COLUMN {column} INTEGER')
+    
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS operations_log (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -67,8 +128,25 @@ def init_database():
     
     # Indexes for performance
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_boxes_status ON boxes(status)')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_operations_date ON operations_log(operation_date)')
+    # Date plus distance covers the log's date-range counts and distance
+    # averages; it replaces the old date-only index
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ops_date_dist ON operations_log(operation_date, distance_traveled)')
+    cursor.execute('DROP INDEX IF EXISTS idx_operations_date')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_boxes_model ON boxes(model_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ops_op_date ON operations_log(operation, operation_date)')
+    cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_analytics_date ON analytics(date)')
+    
+    # Build the daily rollup from the log the first time it is used
+    cursor.execute('''
+        INSERT INTO analytics (date, total_operations, storage_operations, retrieval_operations, avg_distance)
+        SELECT DATE(operation_date), COUNT(*),
+               COUNT(CASE WHEN operation = 'STORED' THEN 1 END),
+               COUNT(CASE WHEN operation = 'RETRIEVED' THEN 1 END),
+               COALESCE(AVG(distance_traveled), 0)
+        FROM operations_log
+        WHERE NOT EXISTS (SELECT 1 FROM analytics)
+        GROUP BY DATE(operation_date)
+    ''')
     
     # Default models
     default_models = [
@@ -79,47 +157,53 @@ def init_database():
         ('Bulk-Box-5x5', 5, 5, 'Bulk', 80.0),
     ]
     
-    for model_name, length, width, category, weight in default_models:
-        try:
-            cursor.execute('''
-                INSERT INTO box_models (model_name, length, width, category, weight)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (model_name, length, width, category, weight))
-        except sqlite3.IntegrityError:
-            pass
+    cursor.executemany('''
+        INSERT OR IGNORE INTO box_models (model_name, length, width, category, weight)
+        VALUES (?, ?, ?, ?, ?)
+    ''', default_models)
     
+    cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
     conn.commit()
-    conn.close()
 
 def get_analytics_data(days=7):
-    """Get analytics data for dashboard"""
-    conn = sqlite3.connect(DATABASE)
+    """Get analytics data for dashboard, reusing results younger than ANALYTICS_TTL"""
+    flush_operation_log()
+    now = time.monotonic()
+    entry = _analytics_cache.get(days)
+    if entry and now - entry[0] < ANALYTICS_TTL:
+        return entry[1]
+    data = _query_analytics(days)
+    _analytics_cache[days] = (now, data)
+    return data
+
+def _query_analytics(days):
+    """Run the dashboard analytics queries"""
+    conn = get_conn()
     cursor = conn.cursor()
     
-    # Last 7 days operations
+    # Dates are bound as parameters (UTC, like CURRENT_TIMESTAMP) so the
+    # statement text never changes between calls
+    today = datetime.now(timezone.utc).date()
+    
+    # Last `days` days operations
     cursor.execute('''
-        SELECT DATE(operation_date), COUNT(*), AVG(distance_traveled)
-        FROM operations_log
-        WHERE operation_date >= datetime('now', '-7 days')
-        GROUP BY DATE(operation_date)
-        ORDER BY DATE(operation_date)
-    ''')
+        SELECT date, total_operations, avg_distance
+        FROM analytics
+        WHERE date >= ?
+        ORDER BY date
+    ''', ((today - timedelta(days=days)).isoformat(),))
     daily_ops = cursor.fetchall()
     
-    # Total statistics
-    cursor.execute('SELECT COUNT(*) FROM boxes WHERE status="stored"')
-    total_stored = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM operations_log WHERE operation="STORED" AND DATE(operation_date) = DATE("now")')
-    today_stored = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT COUNT(*) FROM operations_log WHERE operation="RETRIEVED" AND DATE(operation_date) = DATE("now")')
-    today_retrieved = cursor.fetchone()[0]
-    
-    cursor.execute('SELECT AVG(distance_traveled) FROM operations_log WHERE DATE(operation_date) = DATE("now")')
-    avg_distance = cursor.fetchone()[0] or 0
-    
-    conn.close()
+    # Total and today's statistics
+    cursor.execute('''
+        SELECT (SELECT COUNT(*) FROM boxes WHERE status = 'stored'),
+               storage_operations, retrieval_operations, avg_distance
+        FROM (SELECT 1) LEFT JOIN analytics ON date = ?
+    ''', (today.isoformat(),))
+    total_stored, today_stored, today_retrieved, avg_distance = cursor.fetchone()
+    today_stored = today_stored or 0
+    today_retrieved = today_retrieved or 0
+    avg_distance = avg_distance or 0
     
     return {
         'daily_operations': daily_ops,
@@ -129,9 +213,122 @@ def get_analytics_data(days=7):
         'avg_distance': round(avg_distance, 2)
     }
 
+def _reset_live_stats():
+    """Drop the running counters so the next read reloads them from SQL"""
+    global _live_stats
+    _live_stats = None
+
+def _load_live_stats(today):
+    """Read the running counters for today (UTC) from the database"""
+    flush_operation_log()
+    cursor = get_conn().cursor()
+    cursor.execute('''
+        SELECT (SELECT COUNT(*) FROM boxes WHERE status = 'stored'),
+               storage_operations, retrieval_operations, total_operations, avg_distance
+        FROM (SELECT 1) LEFT JOIN analytics ON date = ?
+    ''', (today,))
+    total_stored, today_stored, today_retrieved, today_ops, avg_distance = cursor.fetchone()
+    return {
+        'date': today,
+        'total_stored': total_stored,
+        'today_stored': today_stored or 0,
+        'today_retrieved': today_retrieved or 0,
+        'distance_sum': (avg_distance or 0) * (today_ops or 0),
+        'distance_count': today_ops or 0,
+    }
+
+def _current_live_stats(today):
+    """Running counters, loaded on first use and with today's counts reset after midnight"""
+    global _live_stats
+    if _live_stats is None:
+        _live_stats = _load_live_stats(today)
+    elif _live_stats['date'] != today:
+        _live_stats.update(date=today, today_stored=0, today_retrieved=0, distance_sum=0, distance_count=0)
+    return _live_stats
+
+def get_live_stats():
+    """Stock and today's counts for the stats panel, without querying the database"""
+    stats = _current_live_stats(datetime.now(timezone.utc).date().isoformat())
+    count = stats['distance_count']
+    return {
+        'total_stored': stats['total_stored'],
+        'today_stored': stats['today_stored'],
+        'today_retrieved': stats['today_retrieved'],
+        'avg_distance': round(stats['distance_sum'] / count, 2) if count else 0
+    }
+
+def log_operation(box_id, operation, distance, duration=None, operator=None):
+    """Queue a STORED/RETRIEVED operation for the log and today's analytics row"""
+    now = datetime.now(timezone.utc)
+    if _live_stats is not None:
+        stats = _current_live_stats(now.date().isoformat())
+        if operation == 'STORED':
+            stats['total_stored'] += 1
+            stats['today_stored'] += 1
+        elif operation == 'RETRIEVED':
+            stats['total_stored'] -= 1
+            stats['today_retrieved'] += 1
+        stats['distance_sum'] += distance
+        stats['distance_count'] += 1
+    _log_buffer.append((box_id, operation, now.strftime('%Y-%m-%d %H:%M:%S'), distance, duration, operator))
+    if len(_log_buffer) >= LOG_BUFFER_SIZE:
+        flush_operation_log()
+
+def flush_operation_log():
+    """Write queued operations and their analytics rollup in one transaction"""
+    if not _log_buffer:
+        return
+    rows = _log_buffer[:]
+    del _log_buffer[:]
+    
+    conn = get_conn()
+    cursor = conn.cursor()
+    
+    cursor.executemany('''
+        INSERT INTO operations_log (box_id, operation, operation_date, distance_traveled, duration, operator)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', rows)
+    
+    cursor.executemany('''
+        INSERT INTO analytics (date, total_operations, storage_operations, retrieval_operations, avg_distance)
+        VALUES (?, 1, ?, ?, ?)
+        ON CONFLICT(date) DO UPDATE SET
+            total_operations = total_operations + 1,
+            storage_operations = storage_operations + excluded.storage_operations,
+            retrieval_operations = retrieval_operations + excluded.retrieval_operations,
+            avg_distance = (avg_distance * total_operations + excluded.avg_distance) / (total_operations + 1)
+    ''', [(date[:10], int(operation == 'STORED'), int(operation == 'RETRIEVED'), distance)
+          for _, operation, date, distance, _, _ in rows])
+    
+    conn.commit()
+    _analytics_cache.clear()
+
+def get_stored_box_positions():
+    """(box_id, row, col, size) for every stored box with a known rack position"""
+    cursor = get_conn().cursor()
+    cursor.execute('''
+        SELECT b.box_id, b.rack_row, b.rack_col, MAX(bm.length, bm.width)
+        FROM boxes b
+        JOIN box_models bm ON b.model_id = bm.id
+        WHERE b.status = 'stored' AND b.rack_row IS NOT NULL
+    ''')
+    return cursor.fetchall()
+
+def snapshot_database(filename):
+    """Write a consistent copy of the whole database to filename"""
+    flush_operation_log()
+    # Build the copy beside the target and swap it in, so a crash mid-write
+    # never leaves a half-written save in place of the previous one
+    tmp = filename + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)  # VACUUM INTO refuses to overwrite
+    get_conn().execute('VACUUM INTO ?', (tmp,))
+    os.replace(tmp, filename)
+
 def export_to_csv(filename):
     """Export operations log to CSV"""
-    conn = sqlite3.connect(DATABASE)
+    flush_operation_log()
+    conn = get_conn()
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -143,12 +340,20 @@ def export_to_csv(filename):
         ORDER BY o.operation_date DESC
     ''')
     
-    data = cursor.fetchall()
-    conn.close()
-    
-    with open(filename, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['ID', 'Box ID', 'Operation', 'Date', 'Distance', 'SKU', 'Model'])
-        writer.writerows(data)
+    # Write in batches straight from the cursor so the log is never held in
+    # memory; the 1 MiB file buffer keeps writes to a few large syscalls
+    count = 0
+    try:
+        with open(filename, 'w', newline='', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(['ID', 'Box ID', 'Operation', 'Date', 'Distance', 'SKU', 'Model'])
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                count += len(rows)
+    finally:
+        cursor.close()  # The connection is shared, so only the cursor is closed
     
-    return len(data)
+    return count
@@ -5,39 +5,99 @@ ASRS WAREHOUSE MANAGEMENT SYSTEM - PATHFINDING
 """
 
 import heapq
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from pathfinding_numba import a_star_nb
+except ImportError:  # Numba is optional - the pure-Python search is used instead
+    a_star_nb = None
+
+# Neighbour steps (up, down, left, right)
+_DIRS = ((-1, 0), (1, 0), (0, -1), (0, 1))
 
 def calculate_distance(start, end):
     """Manhattan distance"""
     return abs(start[0] - end[0]) + abs(start[1] - end[1])
 
+def calculate_distance_batch(starts, ends):
+    """Manhattan distance between matching rows of (..., 2) position arrays"""
+    return np.abs(np.asarray(starts) - np.asarray(ends)).sum(axis=-1)
+
+@lru_cache(maxsize=None)
+def _open_grid(rows, cols):
+    """All-free grid for the kernel - the trolley can reach every rack cell"""
+    return np.zeros((rows, cols), np.uint8)
+
 def a_star_path(start, end, rack):
     """A* pathfinding"""
-    def heuristic(pos):
-        return calculate_distance(pos, end)
+    if a_star_nb is not None and 0 <= start[0] < rack.rows and 0 <= start[1] < rack.cols \
+            and 0 <= end[0] < rack.rows and 0 <= end[1] < rack.cols:
+        path = a_star_nb(_open_grid(rack.rows, rack.cols), start[0], start[1], end[0], end[1])
+        if len(path) == 0:
+            return [], float('inf')
+        return [tuple(p) for p in path.tolist()], len(path) - 1
+    
+    if start == end:
+        return [start], 0
+    end_row, end_col = end
+    if not (0 <= end_row < rack.rows and 0 <= end_col < rack.cols):
+        return [], float('inf')  # Neighbours are always on the grid, so the goal is unreachable
     
-    open_set = []
-    heapq.heappush(open_set, (0 + heuristic(start), 0, start, [start]))
-    visited = set()
+    # Positions are encoded as row * cols + col, so the heap entries
+    # (priority, cost, position), best costs and parents all hold plain ints;
+    # the order matches (row, col) tuples, so paths are unchanged
+    rows, cols = rack.rows, rack.cols
+    start_row, start_col = start
+    end_pos = end_row * cols + end_col
+    g_score = {}
+    came_from = {}
+    if 0 <= start_row < rows and 0 <= start_col < cols:
+        start_pos = start_row * cols + start_col
+        open_set = [(calculate_distance(start, end), 0, start_pos)]
+        g_score[start_pos] = 0
+    else:
+        # An off-grid start has no packed position: queue its on-grid
+        # neighbours directly, parented to -1 (replaced by start below)
+        open_set = []
+        for dr, dc in _DIRS:
+            new_row, new_col = start_row + dr, start_col + dc
+            if 0 <= new_row < rows and 0 <= new_col < cols:
+                neighbor = new_row * cols + new_col
+                g_score[neighbor] = 1
+                came_from[neighbor] = -1
+                open_set.append((1 + abs(new_row - end_row) + abs(new_col - end_col), 1, neighbor))
+        heapq.heapify(open_set)
     
     while open_set:
-        _, cost, current, path = heapq.heappop(open_set)
+        _, cost, current = heapq.heappop(open_set)
         
-        if current == end:
+        if current == end_pos:
+            path = [end]
+            while current in came_from:
+                current = came_from[current]
+                path.append(divmod(current, cols))
+            path[-1] = start
+            path.reverse()
             return path, cost
         
-        if current in visited:
+        # Skip stale entries - a cheaper route to this cell was queued later
+        if cost > g_score[current]:
             continue
-        visited.add(current)
         
-        # Explore neighbors
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_row = current[0] + dr
-            new_col = current[1] + dc
-            
-            if 0 <= new_row < rack.rows and 0 <= new_col < rack.cols:
-                neighbor = (new_row, new_col)
-                new_cost = cost + 1
-                priority = new_cost + heuristic(neighbor)
-                heapq.heappush(open_set, (priority, new_cost, neighbor, path + [neighbor]))
+        # Explore neighbors (up, down, left, right)
+        row, col = divmod(current, cols)
+        new_cost = cost + 1
+        for dr, dc in _DIRS:
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < rows and 0 <= new_col < cols:
+                neighbor = current + dr * cols + dc
+                if new_cost >= g_score.get(neighbor, new_cost + 1):
+                    continue
+                g_score[neighbor] = new_cost
+                came_from[neighbor] = current
+                priority = new_cost + abs(new_row - end_row) + abs(new_col - end_col)
+                heapq.heappush(open_set, (priority, new_cost, neighbor))
     
     return [], float('inf')
@@ -0,0 +1,106 @@
+"""
+============================================================================
+ASRS WAREHOUSE MANAGEMENT SYSTEM - PATHFINDING (NUMBA KERNEL)
+============================================================================
+"""
+
+import numpy as np
+from numba import njit
+
+# Explicit signatures make Numba compile (or load from its cache) at import,
+# during startup, rather than on the first store/retrieve click
+
+@njit('void(i4[:, ::1], i8)', cache=True)
+def _sift_up(heap, i):
+    """Move heap[i] up until its parent is not larger"""
+    while i > 0:
+        parent = (i - 1) >> 1
+        if (heap[parent, 0], heap[parent, 1], heap[parent, 2]) <= (heap[i, 0], heap[i, 1], heap[i, 2]):
+            break
+        for k in range(3):
+            heap[parent, k], heap[i, k] = heap[i, k], heap[parent, k]
+        i = parent
+
+@njit('void(i4[:, ::1], i8)', cache=True)
+def _sift_down(heap, size):
+    """Move heap[0] down until both children are not smaller"""
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and (heap[child + 1, 0], heap[child + 1, 1], heap[child + 1, 2]) < \
+                (heap[child, 0], heap[child, 1], heap[child, 2]):
+            child += 1
+        if (heap[child, 0], heap[child, 1], heap[child, 2]) >= (heap[i, 0], heap[i, 1], heap[i, 2]):
+            break
+        for k in range(3):
+            heap[child, k], heap[i, k] = heap[i, k], heap[child, k]
+        i = child
+
+@njit('i4[:, ::1](u1[:, ::1], i8, i8, i8, i8)', cache=True)
+def a_star_nb(grid, sr, sc, er, ec):
+    """
+    A* over a 2D grid where nonzero cells are blocked
+
+    Heap rows are (priority, cost, row * cols + col), the same ordering as the
+    tuples in pathfinding.a_star_path. Returns the path as an (n, 2) int32
+    array of (row, col), empty if the goal cannot be reached.
+    """
+    rows, cols = grid.shape
+    g_score = np.full((rows, cols), np.iinfo(np.int32).max, np.int32)
+    visited = np.zeros((rows, cols), np.uint8)
+    came_from = np.full((rows, cols, 2), -1, np.int32)
+    # Every push is a strict improvement over one of at most 4 edges per cell
+    heap = np.empty((4 * rows * cols + 1, 3), np.int32)
+
+    g_score[sr, sc] = 0
+    heap[0, 0] = abs(sr - er) + abs(sc - ec)
+    heap[0, 1] = 0
+    heap[0, 2] = sr * cols + sc
+    size = 1
+    found = False
+
+    while size > 0:
+        cost = heap[0, 1]
+        r = heap[0, 2] // cols
+        c = heap[0, 2] - r * cols
+        size -= 1
+        heap[0, :] = heap[size, :]
+        _sift_down(heap, size)
+
+        if visited[r, c]:
+            continue
+        visited[r, c] = 1
+
+        if r == er and c == ec:
+            found = True
+            break
+
+        for k in range(4):
+            nr = r + (-1, 1, 0, 0)[k]
+            nc = c + (0, 0, -1, 1)[k]
+            if nr < 0 or nr >= rows or nc < 0 or nc >= cols or grid[nr, nc] != 0:
+                continue
+            new_cost = cost + 1
+            if new_cost >= g_score[nr, nc]:
+                continue
+            g_score[nr, nc] = new_cost
+            came_from[nr, nc, 0] = r
+            came_from[nr, nc, 1] = c
+            heap[size, 0] = new_cost + abs(nr - er) + abs(nc - ec)
+            heap[size, 1] = new_cost
+            heap[size, 2] = nr * cols + nc
+            _sift_up(heap, size)
+            size += 1
+
+    if not found:
+        return np.empty((0, 2), np.int32)
+
+    path = np.empty((g_score[er, ec] + 1, 2), np.int32)
+    r, c = er, ec
+    for i in range(path.shape[0] - 1, -1, -1):
+        path[i, 0] = r
+        path[i, 1] = c
+        r, c = came_from[r, c, 0], came_from[r, c, 1]
+    return path
@@ -14,8 +14,7 @@ import os
 import heapq
 import sqlite3
 import gc
-from datetime import datetime, timedelta
-from collections import deque
+from datetime import datetime, timedelta, timezone
 import csv
 
 from PySide6.QtWidgets import (
@@ -50,6 +49,9 @@ AISLE_COUNT = 2  # Number of aisles
 ORIGIN_ROW = GRID_ROWS - 1
 ORIGIN_COL = 0
 
+# Grid neighbour offsets: up, down, left, right
+DIRS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
 MODEL_ZONES = {
     1: {'range': (0, 3), 'name': 'Zone-A: Small Items', 'color': QColor(100, 180, 255), 'rgb': (0.4, 0.7, 1.0)},
     2: {'range': (4, 9), 'name': 'Zone-B: Medium Items', 'color': QColor(100, 220, 150), 'rgb': (0.4, 0.86, 0.6)},
@@ -147,18 +149,19 @@ def init_database():
         ('Bulk-Box-5x5', 5, 5, 'Bulk', 80.0),
     ]
     
-    for model_name, length, width, category, weight in default_models:
-        try:
-            cursor.execute('''
-                INSERT INTO box_models (model_name, length, width, category, weight)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (model_name, length, width, category, weight))
-        except sqlite3.IntegrityError:
-            pass
+    cursor.executemany('''
+        INSERT OR IGNORE INTO box_models (model_name, length, width, category, weight)
+        VALUES (?, ?, ?, ?, ?)
+    ''', default_models)
     
     conn.commit()
     conn.close()
 
+def _today_bounds():
+    """(today, tomorrow) as UTC date strings, matching CURRENT_TIMESTAMP"""
+    today = datetime.now(timezone.utc).date()
+    return today.isoformat(), (today + timedelta(days=1)).isoformat()
+
 def get_analytics_data(days=7):
     """Get analytics data for dashboard"""
     conn = sqlite3.connect(DATABASE)
@@ -178,13 +181,16 @@ def get_analytics_data(days=7):
     cursor.execute('SELECT COUNT(*) FROM boxes WHERE status="stored"')
     total_stored = cursor.fetchone()[0]
     
-    cursor.execute('SELECT COUNT(*) FROM operations_log WHERE operation="STORED" AND DATE(operation_date) = DATE("now")')
+    # Today's UTC bounds as parameters, so operation_date can use its index
+    today = _today_bounds()
+    
+    cursor.execute('SELECT COUNT(*) FROM operations_log WHERE operation="STORED" AND operation_date >= ? AND operation_date < ?', today)
     today_stored = cursor.fetchone()[0]
     
-    cursor.execute('SELECT COUNT(*) FROM operations_log WHERE operation="RETRIEVED" AND DATE(operation_date) = DATE("now")')
+    cursor.execute('SELECT COUNT(*) FROM operations_log WHERE operation="RETRIEVED" AND operation_date >= ? AND operation_date < ?', today)
     today_retrieved = cursor.fetchone()[0]
     
-    cursor.execute('SELECT AVG(distance_traveled) FROM operations_log WHERE DATE(operation_date) = DATE("now")')
+    cursor.execute('SELECT AVG(distance_traveled) FROM operations_log WHERE operation_date >= ? AND operation_date < ?', today)
     avg_distance = cursor.fetchone()[0] or 0
     
     conn.close()
@@ -244,39 +250,28 @@ class Rack:
         self.box_locations = {}
         
     def find_nearest_empty_slot(self, model_size, origin_row, origin_col):
-        """Find nearest empty slot using optimized search"""
-        visited = set()
-        queue = deque([(origin_row, origin_col, 0)])
+        """Find nearest empty slot using a summed-area table of occupied cells"""
+        size = model_size
+        if size > self.rows or size > self.cols:
+            return None
         
-        while queue:
-            row, col, dist = queue.popleft()
-            
-            if (row, col) in visited:
-                continue
-            visited.add((row, col))
-            
-            # Check if slot fits the box
-            if self._can_fit(row, col, model_size):
-                return (row, col)
-            
-            # Explore neighbors
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                new_row, new_col = row + dr, col + dc
-                if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
-                    queue.append((new_row, new_col, dist + 1))
+        # Zero-bordered summed-area table: the occupied count of any
+        # size x size window is then four corner lookups
+        occ = np.array([[cell is not None for cell in row] for row in self.grid], dtype=np.int32)
+        sat = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int32)
+        sat[1:, 1:] = occ.cumsum(0).cumsum(1)
+        windows = sat[size:, size:] - sat[:-size, size:] - sat[size:, :-size] + sat[:-size, :-size]
         
-        return None
-    
-    def _can_fit(self, row, col, size):
-        """Check if box can fit at position"""
-        if row + size > self.rows or col + size > self.cols:
-            return False
+        free = windows == 0
+        if not free.any():
+            return None
         
-        for r in range(row, row + size):
-            for c in range(col, col + size):
-                if self.grid[r][c] is not None:
-                    return False
-        return True
+        # Nearest free top-left corner by Manhattan distance
+        rows, cols = np.indices(free.shape)
+        distance = np.abs(rows - origin_row) + np.abs(cols - origin_col)
+        distance = np.where(free, distance, np.iinfo(distance.dtype).max)
+        r, c = divmod(int(distance.argmin()), free.shape[1])
+        return (r, c)
     
     def place_box(self, box_id, row, col, size):
         """Place box on rack"""
@@ -300,12 +295,8 @@ class Rack:
     
     def get_occupied_cells(self):
         """Count occupied cells"""
-        count = 0
-        for row in self.grid:
-            for cell in row:
-                if cell is not None:
-                    count += 1
-        return count
+        # list.count runs in C, so this is one pass per row rather than per cell
+        return sum(len(row) - row.count(None) for row in self.grid)
 
 # ============================================================================
 # PATHFINDING
@@ -320,30 +311,42 @@ def a_star_path(start, end, rack):
     def heuristic(pos):
         return calculate_distance(pos, end)
     
+    # Heap entries are (priority, cost, position); the best known cost and
+    # parent of each position live in dicts, and the path is rebuilt once at the end
     open_set = []
-    heapq.heappush(open_set, (0 + heuristic(start), 0, start, [start]))
-    visited = set()
+    heapq.heappush(open_set, (heuristic(start), 0, start))
+    g_score = {start: 0}
+    came_from = {}
     
     while open_set:
-        _, cost, current, path = heapq.heappop(open_set)
+        _, cost, current = heapq.heappop(open_set)
         
         if current == end:
+            path = [current]
+            while current in came_from:
+                current = came_from[current]
+                path.append(current)
+            path.reverse()
             return path, cost
         
-        if current in visited:
+        # Skip stale entries - a cheaper route to this cell was queued later
+        if cost > g_score[current]:
             continue
-        visited.add(current)
         
         # Explore neighbors
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        for dr, dc in DIRS:
             new_row = current[0] + dr
             new_col = current[1] + dc
             
             if 0 <= new_row < rack.rows and 0 <= new_col < rack.cols:
                 neighbor = (new_row, new_col)
                 new_cost = cost + 1
+                if new_cost >= g_score.get(neighbor, float('inf')):
+                    continue
+                g_score[neighbor] = new_cost
+                came_from[neighbor] = current
                 priority = new_cost + heuristic(neighbor)
-                heapq.heappush(open_set, (priority, new_cost, neighbor, path + [neighbor]))
+                heapq.heappush(open_set, (priority, new_cost, neighbor))
     
     return [], float('inf')
 
@@ -495,6 +498,7 @@ class Realistic3DViewer(QDialog):
         stats_layout = QHBoxLayout(stats_frame)
         
         analytics = get_analytics_data()
+        capacity = self.get_capacity()
         
         # Create stat cards
         stats = [
@@ -502,7 +506,7 @@ class Realistic3DViewer(QDialog):
             ("➕ Today Stored", str(analytics['today_stored']), COLORS['success']),
             ("➖ Today Retrieved", str(analytics['today_retrieved']), COLORS['warning']),
             ("📏 Avg Distance", f"{analytics['avg_distance']}m", COLORS['accent']),
-            ("🏗️ Capacity", f"{self.get_capacity()}%", COLORS['danger'] if self.get_capacity() > 80 else COLORS['success'])
+            ("🏗️ Capacity", f"{capacity}%", COLORS['danger'] if capacity > 80 else COLORS['success'])
         ]
         
         for label_text, value_text, color in stats:
@@ -1042,7 +1046,7 @@ class AnalyticsDashboard(QDialog):
         cursor.execute('SELECT AVG(distance_traveled) FROM operations_log')
         avg_dist = cursor.fetchone()[0] or 0
         
-        cursor.execute('SELECT COUNT(*) FROM operations_log WHERE DATE(operation_date) = DATE("now")')
+        cursor.execute('SELECT COUNT(*) FROM operations_log WHERE operation_date >= ? AND operation_date < ?', _today_bounds())
         today_ops = cursor.fetchone()[0]
         
         cursor.execute('SELECT COUNT(*) FROM boxes WHERE status="stored"')
@@ -110,16 +110,11 @@ def init_database():
         ]
 
         logger.debug("Inserting default models...")
-        for model_name, length, width in default_models:
-            try:
-                cursor.execute('''
-                    INSERT INTO box_models (model_name, length, width)
-                    VALUES (?, ?, ?)
-                ''', (model_name, length, width))
-                logger.debug(f"Added model: {model_name}")
-            except sqlite3.IntegrityError:
-                logger.debug(f"Model already exists: {model_name}")
-                pass
+        cursor.executemany('''
+            INSERT OR IGNORE INTO box_models (model_name, length, width)
+            VALUES (?, ?, ?)
+        ''', default_models)
+        logger.debug(f"Added {cursor.rowcount} new models")
 
         conn.commit()
         conn.close()
@@ -6,9 +6,9 @@ ASRS WAREHOUSE MANAGEMENT SYSTEM - ANALYTICS DASHBOARD
 
 import sys
 import os
+from datetime import datetime, timedelta, timezone
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import sqlite3
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFrame, QLabel, QPushButton,
     QTabWidget, QWidget, QGridLayout, QTableWidget, QTableWidgetItem,
@@ -21,8 +21,8 @@ matplotlib.use('Qt5Agg')
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
-from config import COLORS, DATABASE, GRID_ROWS, GRID_COLS
-from database import get_analytics_data, export_to_csv
+from config import COLORS, GRID_ROWS, GRID_COLS
+from database import get_analytics_data, export_to_csv, get_conn, flush_operation_log
 
 class AnalyticsDashboard(QDialog):
     """Professional Analytics Dashboard"""
@@ -217,9 +217,9 @@ class AnalyticsDashboard(QDialog):
             }}
         """)
         
-        # Load data
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
+        # Load data (queued log entries first, so the newest operations show)
+        flush_operation_log()
+        cursor = get_conn().cursor()
         cursor.execute('''
             SELECT o.box_id, o.operation, o.operation_date, 
                    o.distance_traveled, b.sku, bm.model_name
@@ -230,7 +230,6 @@ class AnalyticsDashboard(QDialog):
             LIMIT 100
         ''')
         data = cursor.fetchall()
-        conn.close()
         
         table.setColumnCount(6)
         table.setHorizontalHeaderLabels(['Box ID', 'Operation', 'Date', 'Distance (m)', 'SKU', 'Model'])
@@ -263,20 +262,19 @@ class AnalyticsDashboard(QDialog):
         title.setStyleSheet("font-size: 16px; font-weight: bold; color: white;")
         efficiency_layout.addWidget(title)
         
-        # Calculate metrics
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT AVG(distance_traveled) FROM operations_log')
-        avg_dist = cursor.fetchone()[0] or 0
-        
-        cursor.execute('SELECT COUNT(*) FROM operations_log WHERE DATE(operation_date) = DATE("now")')
-        today_ops = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM boxes WHERE status="stored"')
-        total_stored = cursor.fetchone()[0]
-        
-        conn.close()
+        # Calculate metrics in one statement on the shared connection; today's
+        # bounds are bound as UTC dates like the rest of the analytics queries
+        flush_operation_log()
+        today = datetime.now(timezone.utc).date()
+        cursor = get_conn().cursor()
+        cursor.execute('''
+            SELECT (SELECT AVG(distance_traveled) FROM operations_log),
+                   (SELECT COUNT(*) FROM operations_log
+                    WHERE operation_date >= ? AND operation_date < ?),
+                   (SELECT COUNT(*) FROM boxes WHERE status = 'stored')
+        ''', (today.isoformat(), (today + timedelta(days=1)).isoformat()))
+        avg_dist, today_ops, total_stored = cursor.fetchone()
+        avg_dist = avg_dist or 0
         
         capacity = int((total_stored * 100) / (GRID_ROWS * GRID_COLS))
         efficiency_score = max(0, 100 - (avg_dist * 2) - (capacity * 0.5))
@@ -9,28 +9,228 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import json
-import sqlite3
 import datetime
 
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QPushButton, QLineEdit, QLabel, QMessageBox,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QPushButton, QLineEdit, QLabel, QMessageBox,
     QComboBox, QScrollArea, QGroupBox, QSplitter, QFrame, QTextEdit,
-    QStackedWidget, QGridLayout, QApplication, QFormLayout, QSizePolicy
+    QStackedWidget, QGridLayout, QApplication, QFormLayout, QSizePolicy, QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtCore import Qt, QTimer, QElapsedTimer, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QPixmap, QPalette, QFont
 
 from config import (
-    DATABASE, SAVE_FILE, GRID_ROWS, GRID_COLS, RACK_HEIGHT_LEVELS,
+    DATABASE, SAVE_FILE, LEGACY_SAVE_FILE, GRID_ROWS, GRID_COLS, RACK_HEIGHT_LEVELS,
     ORIGIN_ROW, ORIGIN_COL, MODEL_ZONES, COLORS
 )
-from database import init_database, get_analytics_data
-from core import Rack
+from database import (
+    init_database, get_live_stats, log_operation, flush_operation_log, get_conn, close_conn,
+    get_stored_box_positions, snapshot_database
+)
+from core import Rack, EMPTY
 from pathfinding import calculate_distance, a_star_path
 from visualization import Realistic3DViewer
 from ui.analytics_dashboard import AnalyticsDashboard
 
+# ============================================================================
+# SQL STATEMENTS
+# ============================================================================
+# Kept as constants so every call sends the same text and hits the
+# connection's prepared-statement cache
+
+SQL_MODELS = 'SELECT id, model_name, length, width FROM box_models'
+
+SQL_INSERT_BOX = '''
+    INSERT INTO boxes (model_id, sku, description, level, status, rack_row, rack_col)
+    VALUES (?, ?, ?, ?, 'stored', ?, ?)
+'''
+
+_SQL_STORED_BOXES = '''
+    SELECT b.box_id, bm.model_name, b.description, b.placement_date
+    FROM boxes b
+    JOIN box_models bm ON b.model_id = bm.id
+    WHERE b.status = 'stored'
+'''
+
+# Retrieval list per method: by ID, oldest first (FIFO), newest first (LIFO)
+SQL_RETRIEVAL_LIST = {
+    'By ID': _SQL_STORED_BOXES + 'ORDER BY b.box_id ASC',
+    'FIFO (First In)': _SQL_STORED_BOXES + 'ORDER BY b.placement_date ASC',
+    'LIFO (Last In)': _SQL_STORED_BOXES + 'ORDER BY b.placement_date DESC',
+}
+
+SQL_BOX_MODEL_NAME = '''
+    SELECT bm.model_name FROM boxes b
+    JOIN box_models bm ON b.model_id = bm.id
+    WHERE b.box_id = ?
+'''
+
+SQL_MARK_RETRIEVED = '''
+    UPDATE boxes SET status='retrieved', retrieval_date=CURRENT_TIMESTAMP WHERE box_id=?
+'''
+
+SQL_INVENTORY = '''
+    SELECT b.box_id, b.sku, bm.model_name, b.placement_date
+    FROM boxes b
+    JOIN box_models bm ON b.model_id = bm.id
+    WHERE b.status = 'stored'
+    ORDER BY b.placement_date DESC
+    LIMIT ?
+'''
+INVENTORY_LIMIT = 200  # Newest boxes shown unless "Show all" is ticked
+
+# Trolley animation: one path step per ANIMATION_STEP_MS, sped up so that
+# long paths still finish within MAX_ANIMATION_MS; frames are drawn at ~60 Hz
+ANIMATION_STEP_MS = 100
+MAX_ANIMATION_MS = 4000
+ANIMATION_FRAME_MS = 16
+
+# Theme stylesheets, filled in with COLORS once at import
+MAIN_WINDOW_QSS = f"""
+    QMainWindow {{
+        background-color: {COLORS['dark']};
+    }}
+    QLabel {{
+        color: white;
+    }}
+    QPushButton {{
+        background-color: {COLORS['secondary']};
+        color: white;
+        border: none;
+        padding: 10px 15px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 11px;
+    }}
+    QPushButton:hover {{
+        background-color: {COLORS['accent']};
+    }}
+    QPushButton:pressed {{
+        background-color: {COLORS['primary']};
+    }}
+    QLineEdit, QComboBox {{
+        background-color: {COLORS['secondary']};
+        color: white;
+        border: 1px solid {COLORS['accent']};
+        padding: 8px;
+        border-radius: 4px;
+    }}
+    QTableView {{
+        background-color: {COLORS['sidebar']};
+        color: white;
+        border: none;
+        gridline-color: {COLORS['secondary']};
+    }}
+    QHeaderView::section {{
+        background-color: {COLORS['secondary']};
+        color: white;
+        padding: 8px;
+        border: none;
+        font-weight: bold;
+    }}
+    QTextEdit {{
+        background-color: {COLORS['sidebar']};
+        color: white;
+        border: 1px solid {COLORS['secondary']};
+        border-radius: 4px;
+        padding: 8px;
+    }}
+    QGroupBox {{
+        color: white;
+        border: 2px solid {COLORS['secondary']};
+        border-radius: 8px;
+        margin-top: 10px;
+        font-weight: bold;
+        padding-top: 10px;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 5px 10px;
+        background-color: {COLORS['secondary']};
+        border-radius: 4px;
+    }}
+"""
+
+SPLITTER_QSS = f"""
+    QSplitter::handle {{
+        background-color: {COLORS['secondary']};
+    }}
+"""
+
+TOP_BAR_QSS = f"""
+    QFrame {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 {COLORS['primary']}, stop:1 {COLORS['accent']});
+        padding: 10px;
+    }}
+"""
+
+ALERT_QSS = f"""
+    QMessageBox {{
+        background-color: {COLORS['sidebar']};
+    }}
+    QMessageBox QLabel {{
+        color: white;
+        font-size: 12px;
+        padding: 10px;
+        min-width: 300px;
+    }}
+    QMessageBox QPushButton {{
+        background-color: {COLORS['primary']};
+        color: white;
+        border: none;
+        padding: 8px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+        min-width: 80px;
+    }}
+    QMessageBox QPushButton:hover {{
+        background-color: {COLORS['accent']};
+    }}
+"""
+
+ALERT_ICONS = {
+    "info": QMessageBox.Information,
+    "warning": QMessageBox.Warning,
+    "error": QMessageBox.Critical,
+}
+
+# Changes within this window are drawn in a single 3D render
+RENDER_3D_DELAY_MS = 100
+
+class InventoryModel(QAbstractTableModel):
+    """Read-only inventory rows; the view only asks for the cells on screen"""
+    
+    HEADERS = ['Box ID', 'SKU', 'Model', 'Date']
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def set_rows(self, rows):
+        """Replace every row with the given list of tuples"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self._rows[index.row()][index.column()])
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
 class BusinessASRSMainWindow(QMainWindow):
     """Business-Grade Main Application Window"""
     
@@ -38,11 +238,20 @@ class BusinessASRSMainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("🏭 Professional ASRS Warehouse Management System v2.0")
 
+        self._alert_box = None  # Created by the first show_alert
+
         # Initialize data
         init_database()
         self.rack = Rack(GRID_ROWS, GRID_COLS)
         self.load_state()
 
+        # Zone color of every rack row (rows outside all zones use the panel color)
+        self._row_zone_color = [QColor(COLORS['secondary'])] * GRID_ROWS
+        for zone_info in MODEL_ZONES.values():
+            zone_start, zone_end = zone_info['range']
+            for row in range(zone_start, zone_end + 1):
+                self._row_zone_color[row] = zone_info['color']
+
         # Animation and trolley state
         self.trolley_row = ORIGIN_ROW
         self.trolley_col = ORIGIN_COL
@@ -53,79 +262,34 @@ class BusinessASRSMainWindow(QMainWindow):
         self.pending_position = None
         self.pending_size = None
         self.grid_cells = []
+        self._dirty_cells = set()  # Grid cells to redraw on the next refresh_grid
+        self._inventory_dirty = True  # Inventory table skipped while hidden
         
         # Professional theme
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {COLORS['dark']};
-            }}
-            QLabel {{
-                color: white;
-            }}
-            QPushButton {{
-                background-color: {COLORS['secondary']};
-                color: white;
-                border: none;
-                padding: 10px 15px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['accent']};
-            }}
-            QPushButton:pressed {{
-                background-color: {COLORS['primary']};
-            }}
-            QLineEdit, QComboBox {{
-                background-color: {COLORS['secondary']};
-                color: white;
-                border: 1px solid {COLORS['accent']};
-                padding: 8px;
-                border-radius: 4px;
-            }}
-            QTableWidget {{
-                background-color: {COLORS['sidebar']};
-                color: white;
-                border: none;
-                gridline-color: {COLORS['secondary']};
-            }}
-            QHeaderView::section {{
-                background-color: {COLORS['secondary']};
-                color: white;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }}
-            QTextEdit {{
-                background-color: {COLORS['sidebar']};
-                color: white;
-                border: 1px solid {COLORS['secondary']};
-                border-radius: 4px;
-                padding: 8px;
-            }}
-            QGroupBox {{
-                color: white;
-                border: 2px solid {COLORS['secondary']};
-                border-radius: 8px;
-                margin-top: 10px;
-                font-weight: bold;
-                padding-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-                background-color: {COLORS['secondary']};
-                border-radius: 4px;
-            }}
-        """)
+        self.setStyleSheet(MAIN_WINDOW_QSS)
+
+        # Deferred 3D render, started by the first grid change after a render
+        self._3d_dirty = False
+        self.render_3d_timer = QTimer(self)
+        self.render_3d_timer.setSingleShot(True)
+        self.render_3d_timer.setInterval(RENDER_3D_DELAY_MS)
+        self.render_3d_timer.timeout.connect(self._render_3d_if_dirty)
 
         self.setup_ui()
 
         # Animation timer
         self.animation_timer = QTimer()
+        self.animation_timer.setTimerType(Qt.PreciseTimer)
+        self.animation_timer.setInterval(ANIMATION_FRAME_MS)
         self.animation_timer.timeout.connect(self.animate_trolley)
+        self.animation_clock = QElapsedTimer()
+        self.animation_step_ms = ANIMATION_STEP_MS
+        self.animation_steps = 0
+
+        # Write queued operation log entries in batches
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.timeout.connect(flush_operation_log)
+        self.log_flush_timer.start(500)
 
         # Get screen size and calculate responsive dimensions
         screen = QApplication.primaryScreen().geometry()
@@ -156,11 +320,7 @@ class BusinessASRSMainWindow(QMainWindow):
         
         # Main Content
         splitter = QSplitter(Qt.Horizontal)
-        splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background-color: {COLORS['secondary']};
-            }}
-        """)
+        splitter.setStyleSheet(SPLITTER_QSS)
         
         # Left Panel - Controls
         left_panel = self.create_left_panel()
@@ -187,13 +347,7 @@ class BusinessASRSMainWindow(QMainWindow):
     def create_top_bar(self):
         """Create top navigation bar"""
         top_bar = QFrame()
-        top_bar.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 {COLORS['primary']}, stop:1 {COLORS['accent']});
-                padding: 10px;
-            }}
-        """)
+        top_bar.setStyleSheet(TOP_BAR_QSS)
         layout = QHBoxLayout(top_bar)
         layout.setSpacing(10)
 
@@ -320,7 +474,10 @@ class BusinessASRSMainWindow(QMainWindow):
     def create_center_panel(self):
         """Create center visualization panel"""
         panel = QFrame()
-        panel.setStyleSheet(f"background-color: {COLORS['dark']};")
+        # Scoped so the dark background does not cascade onto the grid cells,
+        # whose colours come from their palettes
+        panel.setObjectName("centerPanel")
+        panel.setStyleSheet(f"QFrame#centerPanel {{ background-color: {COLORS['dark']}; }}")
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(10, 8, 10, 8)
         layout.setSpacing(0)
@@ -346,6 +503,7 @@ class BusinessASRSMainWindow(QMainWindow):
 
         # --- 3D visualization page ---
         self.view_3d_widget = Realistic3DViewer(self.rack)
+        self._3d_dirty = False  # The viewer draws the current rack when first shown
         self.view_stack.addWidget(self.view_3d_widget)  # Index 1
 
         layout.addWidget(self.view_stack)
@@ -362,13 +520,18 @@ class BusinessASRSMainWindow(QMainWindow):
         # Grid Scroll Area
         scroll = QScrollArea()
         scroll.setWidgetResizable(False)
-        scroll.setStyleSheet(f"background-color: {COLORS['dark']};")
+        scroll.setStyleSheet(f"QScrollArea {{ background-color: {COLORS['dark']}; }}")
         
         grid_container = QWidget()
+        grid_container.setObjectName("gridContainer")
+        # Cells are coloured through their palettes, so no background or
+        # border rule may match them (either makes Qt turn off their
+        # autoFillBackground); the dark spacing between them is the border
+        grid_container.setStyleSheet(f"QWidget#gridContainer {{ background-color: {COLORS['dark']}; }}")
         grid_layout = QGridLayout(grid_container)
-        grid_layout.setSpacing(1)
+        grid_layout.setSpacing(3)
         
-        cell_size = 18
+        cell_size = 16
         
         # Add column numbers (starting from column 2 to leave space for zone and row numbers)
         for col in range(GRID_COLS):
@@ -401,6 +564,14 @@ class BusinessASRSMainWindow(QMainWindow):
             """)
             grid_layout.addWidget(zone_label, start_row + 1, 0, row_span, 1)
 
+        # Palettes are built once; occupied cells take their row's zone color
+        self._empty_cell_palette = self._cell_palette(QColor(COLORS['secondary']))
+        self._trolley_cell_palette = self._cell_palette(QColor(COLORS['accent']))
+        self._box_cell_palettes = [self._cell_palette(self.get_zone_color(row)) for row in range(GRID_ROWS)]
+        self._box_cell_font = QFont()
+        self._box_cell_font.setPixelSize(7)
+        self._box_cell_font.setBold(True)
+
         self.grid_cells = []
         for row in range(GRID_ROWS):
             row_cells = []
@@ -409,17 +580,25 @@ class BusinessASRSMainWindow(QMainWindow):
                 cell = QLabel()
                 cell.setFixedSize(cell_size, cell_size)
                 cell.setAlignment(Qt.AlignCenter)
+                cell.setAutoFillBackground(True)
                 
                 grid_layout.addWidget(cell, row + 1, col + 2)
                 row_cells.append(cell)
             self.grid_cells.append(row_cells)
         
-        self.refresh_grid() # Initial population of grid
+        self.refresh_grid(full=True) # Initial population of grid
         
         scroll.setWidget(grid_container)
         container_layout.addWidget(scroll)
 
         return container
+
+    def _cell_palette(self, color):
+        """Palette for a grid cell filled with the given color"""
+        palette = QPalette()
+        palette.setColor(QPalette.Window, color)
+        palette.setColor(QPalette.WindowText, QColor("white"))
+        return palette
     
     def create_right_panel(self):
         """Create right info panel"""
@@ -446,17 +625,22 @@ class BusinessASRSMainWindow(QMainWindow):
         inventory_group = QGroupBox("📦 Current Inventory")
         inventory_layout = QVBoxLayout(inventory_group)
 
-        self.inventory_table = QTableWidget()
-        self.inventory_table.setColumnCount(4)
-        self.inventory_table.setHorizontalHeaderLabels(['Box ID', 'SKU', 'Model', 'Date'])
+        self.inventory_model = InventoryModel(self)
+        self.inventory_table = QTableView()
+        self.inventory_table.setModel(self.inventory_model)
         self.inventory_table.horizontalHeader().setStretchLastSection(True)
         self.inventory_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.update_inventory_table()
         inventory_layout.addWidget(self.inventory_table)
         
+        inventory_buttons = QHBoxLayout()
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.clicked.connect(self.update_inventory_table)
-        inventory_layout.addWidget(refresh_btn)
+        inventory_buttons.addWidget(refresh_btn)
+        self.inventory_show_all = QCheckBox(f"Show all (default: newest {INVENTORY_LIMIT})")
+        self.inventory_show_all.toggled.connect(self.update_inventory_table)
+        inventory_buttons.addWidget(self.inventory_show_all)
+        inventory_layout.addLayout(inventory_buttons)
+        self.update_inventory_table()
         
         layout.addWidget(inventory_group)
         
@@ -502,14 +686,14 @@ class BusinessASRSMainWindow(QMainWindow):
     
     def load_models(self):
         """Load box models from database"""
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, model_name, length, width FROM box_models')
-        models = cursor.fetchall()
-        conn.close()
+        # Models rarely change, so store_item reads them from this cache
+        self._models = {
+            model_id: (name, length, width)
+            for model_id, name, length, width in get_conn().execute(SQL_MODELS)
+        }
 
         self.model_combo.clear()
-        for model_id, name, length, width in models:
+        for model_id, (name, length, width) in self._models.items():
             self.model_combo.addItem(f"{name} ({length}×{width})", model_id)
 
         # Initialize retrieval box list
@@ -525,45 +709,35 @@ class BusinessASRSMainWindow(QMainWindow):
         description = self.desc_input.text().strip()
         
         # Get model info
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
-        cursor.execute('SELECT length, width FROM box_models WHERE id=?', (model_id,))
-        result = cursor.fetchone()
+        result = self._models.get(model_id)
         
         if not result:
-            conn.close()
             self.show_alert("Model Not Found", "The selected model was not found in the system.\n\nPlease select a valid model.", "error")
             return
         
-        length, width = result
+        _, length, width = result
         size = max(length, width)
         
         # Find slot
         slot = self.rack.find_nearest_empty_slot(size, ORIGIN_ROW, ORIGIN_COL)
         
         if not slot:
-            conn.close()
             self.show_alert("No Available Slot", "No available storage slot found for this item.\n\nThe warehouse may be full or the designated zone is at capacity.", "warning")
             return
         
         # Store in database
-        cursor.execute('''
-            INSERT INTO boxes (model_id, sku, description, level, status)
-            VALUES (?, ?, ?, ?, 'stored')
-        ''', (model_id, "", description, slot[0] % RACK_HEIGHT_LEVELS))
+        conn = get_conn()
+        cursor = conn.cursor()
+        cursor.execute(SQL_INSERT_BOX, (model_id, "", description, slot[0] % RACK_HEIGHT_LEVELS, slot[0], slot[1]))
         box_id = cursor.lastrowid
         
         # Calculate distance
         distance = calculate_distance((ORIGIN_ROW, ORIGIN_COL), slot)
         
-        # Log operation
-        cursor.execute('''
-            INSERT INTO operations_log (box_id, operation, distance_traveled)
-            VALUES (?, 'STORED', ?)
-        ''', (box_id, distance))
-        
         conn.commit()
-        conn.close()
+        
+        # Log operation (written in the background by the log flush timer)
+        log_operation(box_id, 'STORED', distance)
         
         # Animate trolley
         path, _ = a_star_path((ORIGIN_ROW, ORIGIN_COL), slot, self.rack)
@@ -574,47 +748,18 @@ class BusinessASRSMainWindow(QMainWindow):
         self.pending_size = size
         self.operation_mode = 'storing'
         
-        self.animation_timer.start(100) # ms for each step
-        self.is_animating = True
+        self._start_animation()
     
     def refresh_retrieval_list(self):
         """Refresh the retrieval box list based on selected method"""
         method = self.retrieval_method_combo.currentText()
         self.retrieve_box_combo.clear()
 
-        conn = sqlite3.connect(DATABASE)
+        conn = get_conn()
         cursor = conn.cursor()
 
-        if method == 'By ID':
-            # Show all boxes sorted by ID
-            cursor.execute('''
-                SELECT b.box_id, bm.model_name, b.description, b.placement_date
-                FROM boxes b
-                JOIN box_models bm ON b.model_id = bm.id
-                WHERE b.status = 'stored'
-                ORDER BY b.box_id ASC
-            ''')
-        elif method == 'FIFO (First In)':
-            # Show all boxes sorted by oldest first
-            cursor.execute('''
-                SELECT b.box_id, bm.model_name, b.description, b.placement_date
-                FROM boxes b
-                JOIN box_models bm ON b.model_id = bm.id
-                WHERE b.status = 'stored'
-                ORDER BY b.placement_date ASC
-            ''')
-        elif method == 'LIFO (Last In)':
-            # Show all boxes sorted by newest first
-            cursor.execute('''
-                SELECT b.box_id, bm.model_name, b.description, b.placement_date
-                FROM boxes b
-                JOIN box_models bm ON b.model_id = bm.id
-                WHERE b.status = 'stored'
-                ORDER BY b.placement_date DESC
-            ''')
-
-        results = cursor.fetchall()
-        conn.close()
+        query = SQL_RETRIEVAL_LIST.get(method)
+        results = cursor.execute(query).fetchall() if query else []
 
         if not results:
             self.retrieve_box_combo.addItem("No items in warehouse", None)
@@ -643,22 +788,17 @@ class BusinessASRSMainWindow(QMainWindow):
             self.show_alert("No Box Selected", "No boxes available for retrieval.\n\nPlease store items first.", "warning")
             return
 
-        if box_id not in self.rack.box_locations:
+        if self.rack.locate(box_id) is None:
             self.show_alert("Box Not Found", f"Box #{box_id} not found in the warehouse.\n\nPlease refresh the list.", "error")
             return
 
         method = self.retrieval_method_combo.currentText()
 
         # Get box info for logging
-        conn = sqlite3.connect(DATABASE)
+        conn = get_conn()
         cursor = conn.cursor()
-        cursor.execute('''
-            SELECT bm.model_name FROM boxes b
-            JOIN box_models bm ON b.model_id = bm.id
-            WHERE b.box_id = ?
-        ''', (box_id,))
+        cursor.execute(SQL_BOX_MODEL_NAME, (box_id,))
         result = cursor.fetchone()
-        conn.close()
 
         model_name = result[0] if result else "Unknown"
 
@@ -674,7 +814,7 @@ class BusinessASRSMainWindow(QMainWindow):
     def _start_retrieval(self, box_id, log_message=None):
         """Common method to start retrieval animation"""
         # Get location
-        row, col, size = self.rack.box_locations[box_id]
+        row, col, size = self.rack.locate(box_id)
 
         # Animate trolley
         path, _ = a_star_path((ORIGIN_ROW, ORIGIN_COL), (row, col), self.rack)
@@ -687,8 +827,7 @@ class BusinessASRSMainWindow(QMainWindow):
         if log_message:
             self.log_text.append(f"🔄 {log_message}")
 
-        self.animation_timer.start(100) # ms for each step
-        self.is_animating = True
+        self._start_animation()
 
     def complete_operation(self):
         """Complete the operation after animation."""
@@ -710,20 +849,16 @@ class BusinessASRSMainWindow(QMainWindow):
         elif self.operation_mode == 'retrieving':
             # Finish retrieving
             box_id = self.pending_box_id
-            row, col, size = self.rack.box_locations[box_id]
+            row, col, size = self.rack.locate(box_id)
             distance = calculate_distance((row, col), (ORIGIN_ROW, ORIGIN_COL))
             # Remove from rack
             self.rack.remove_box(box_id)
             # Update database
-            conn = sqlite3.connect(DATABASE)
+            conn = get_conn()
             cursor = conn.cursor()
-            cursor.execute('UPDATE boxes SET status="retrieved", retrieval_date=CURRENT_TIMESTAMP WHERE box_id=?', (box_id,))
-            cursor.execute('''
-                INSERT INTO operations_log (box_id, operation, distance_traveled)
-                VALUES (?, 'RETRIEVED', ?)
-            ''', (box_id, distance))
+            cursor.execute(SQL_MARK_RETRIEVED, (box_id,))
             conn.commit()
-            conn.close()
+            log_operation(box_id, 'RETRIEVED', distance)
             # UI updates
             self.log_text.append(f"✅ Retrieved Box #{box_id} from ({row}, {col}) - Distance: {distance}m")
             self.update_stats()
@@ -734,7 +869,7 @@ class BusinessASRSMainWindow(QMainWindow):
     
     def update_stats(self):
         """Update statistics display"""
-        analytics = get_analytics_data()
+        analytics = get_live_stats()
         capacity = int((analytics['total_stored'] * 100) / (GRID_ROWS * GRID_COLS))
         
         stats_html = f"""
@@ -749,57 +884,67 @@ class BusinessASRSMainWindow(QMainWindow):
         self.stats_label.setText(stats_html)
     
     def update_inventory_table(self):
-        """Update inventory table"""
-        conn = sqlite3.connect(DATABASE)
+        """Update inventory table (deferred until shown while hidden)"""
+        if not self.inventory_table.isVisible():
+            self._inventory_dirty = True
+            return
+        self._inventory_dirty = False
+        
+        limit = -1 if self.inventory_show_all.isChecked() else INVENTORY_LIMIT
+        conn = get_conn()
         cursor = conn.cursor()
-        cursor.execute('''
-            SELECT b.box_id, b.sku, bm.model_name, b.placement_date
-            FROM boxes b
-            JOIN box_models bm ON b.model_id = bm.id
-            WHERE b.status = 'stored'
-            ORDER BY b.placement_date DESC
-        ''')
-        data = cursor.fetchall()
-        conn.close()
-        
-        self.inventory_table.setRowCount(len(data))
-        
-        for row_idx, row_data in enumerate(data):
-            for col_idx, value in enumerate(row_data):
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.inventory_table.setItem(row_idx, col_idx, item)
+        cursor.execute(SQL_INVENTORY, (limit,))
+        self.inventory_model.set_rows(cursor.fetchall())
+    
+    def showEvent(self, event):
+        """Fill the inventory table if it changed while the window was hidden"""
+        super().showEvent(event)
+        if self._inventory_dirty:
+            self.update_inventory_table()
     
-    def refresh_grid(self):
-        """Refresh grid visualization by updating existing cells."""
+    def refresh_grid(self, full=False):
+        """Refresh grid visualization by updating the cells that changed."""
         if not self.grid_cells:
             return
 
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS):
-                cell = self.grid_cells[row][col]
-                zone_color = self.get_zone_color(row)
-                
-                if self.is_animating and row == self.trolley_row and col == self.trolley_col:
-                    cell.setStyleSheet(f"background-color: {COLORS['accent']}; border: 1px solid white;")
-                    cell.setText("🚚")
-                    cell.setToolTip(f"Trolley at ({row}, {col})")
-                elif self.rack.grid[row][col] is not None:
-                    cell.setStyleSheet(f"background-color: {zone_color.name()}; border: 1px solid black; font-size: 7px; color: white; font-weight: bold;")
-                    cell.setText(str(self.rack.grid[row][col]))
-                    cell.setToolTip(f"Box ID: {self.rack.grid[row][col]}")
-                else:
-                    cell.setStyleSheet(f"background-color: {COLORS['secondary']}; border: 1px solid {COLORS['dark']};")
-                    cell.setText("")
-                    cell.setToolTip(f"Empty ({row}, {col})")
+        dirty = self._dirty_cells
+        dirty |= self.rack.dirty_cells
+        self.rack.dirty_cells.clear()
+        if full:
+            cells = [(row, col) for row in range(GRID_ROWS) for col in range(GRID_COLS)]
+        else:
+            cells = dirty
+
+        for row, col in cells:
+            cell = self.grid_cells[row][col]
+            box_id = self.rack.grid[row, col]
+            
+            if self.is_animating and row == self.trolley_row and col == self.trolley_col:
+                cell.setPalette(self._trolley_cell_palette)
+                cell.setFont(self.font())
+                cell.setText("🚚")
+                cell.setToolTip(f"Trolley at ({row}, {col})")
+            elif box_id != EMPTY:
+                cell.setPalette(self._box_cell_palettes[row])
+                cell.setFont(self._box_cell_font)
+                cell.setText(str(box_id))
+                cell.setToolTip(f"Box ID: {box_id}")
+            else:
+                cell.setPalette(self._empty_cell_palette)
+                cell.setText("")
+                cell.setToolTip(f"Empty ({row}, {col})")
+        if cells:
+            self._schedule_3d_render()
+        dirty.clear()
+    
+    def _mark_trolley_dirty(self):
+        """Queue the trolley's current cell for redraw"""
+        if 0 <= self.trolley_row < GRID_ROWS and 0 <= self.trolley_col < GRID_COLS:
+            self._dirty_cells.add((self.trolley_row, self.trolley_col))
         
     def get_zone_color(self, row):
         """Get zone color for row"""
-        for model_id, zone_info in MODEL_ZONES.items():
-            zone_start, zone_end = zone_info['range']
-            if zone_start <= row <= zone_end:
-                return zone_info['color']
-        return QColor(COLORS['secondary'])
+        return self._row_zone_color[row]
 
     def show_grid_view(self):
         """Switch to the grid view."""
@@ -807,8 +952,23 @@ class BusinessASRSMainWindow(QMainWindow):
 
     def show_3d_view(self):
         """Switch to the 3D view."""
-        self.view_3d_widget.render_realistic_warehouse() # Refresh the view
+        if self.view_3d_widget.ax is None:
+            self._3d_dirty = False  # Its first showEvent draws the current rack
         self.view_stack.setCurrentIndex(1)
+        self._render_3d_if_dirty() # Catch up on changes made while hidden
+
+    def _schedule_3d_render(self):
+        """Mark the 3D view stale and render it once the delay has passed"""
+        self._3d_dirty = True
+        if not self.render_3d_timer.isActive():
+            self.render_3d_timer.start()
+
+    def _render_3d_if_dirty(self):
+        """Render the 3D view if it is on screen and out of date"""
+        if not self._3d_dirty or self.view_stack.currentIndex() != 1 or not self.view_3d_widget.isVisible():
+            return
+        self._3d_dirty = False
+        self.view_3d_widget.render_realistic_warehouse()
 
     def toggle_fullscreen(self):
         """Toggle between maximized and normal window state."""
@@ -820,69 +980,61 @@ class BusinessASRSMainWindow(QMainWindow):
             print("Switching to maximized state.")
             self.showMaximized()
 
+    def _get_alert_box(self):
+        """Message box shared by every alert, styled once on first use"""
+        if self._alert_box is None:
+            msg_box = QMessageBox(self)
+            msg_box.setStyleSheet(ALERT_QSS)
+
+            # Set word wrap on the label programmatically
+            try:
+                label = msg_box.findChild(QLabel, "qt_msgbox_label")
+                if label:
+                    label.setWordWrap(True)
+            except Exception:
+                pass # Failsafe if the label name changes in future Qt versions
+
+            self._alert_box = msg_box
+        return self._alert_box
+
     def show_alert(self, title, message, icon_type="info"):
         """Show styled alert message box"""
-        msg_box = QMessageBox(self)
+        msg_box = self._get_alert_box()
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
+        msg_box.setIcon(ALERT_ICONS.get(icon_type, QMessageBox.NoIcon))
 
-        if icon_type == "info":
-            msg_box.setIcon(QMessageBox.Information)
-        elif icon_type == "warning":
-            msg_box.setIcon(QMessageBox.Warning)
-        elif icon_type == "error":
-            msg_box.setIcon(QMessageBox.Critical)
         if icon_type == "question":
             msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-
-        msg_box.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {COLORS['sidebar']};
-            }}
-            QMessageBox QLabel {{
-                color: white;
-                font-size: 12px;
-                padding: 10px;
-                min-width: 300px;
-            }}
-            QMessageBox QPushButton {{
-                background-color: {COLORS['primary']};
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 80px;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: {COLORS['accent']};
-            }}
-        """)
-
-        # Set word wrap on the label programmatically
-        try:
-            label = msg_box.findChild(QLabel, "qt_msgbox_label")
-            if label:
-                label.setWordWrap(True)
-        except Exception:
-            pass # Failsafe if the label name changes in future Qt versions
-
-        if icon_type == "question":
             return msg_box.exec() == QMessageBox.Yes
         else:
+            msg_box.setStandardButtons(QMessageBox.Ok)
             msg_box.exec()
             return None
 
+    def _start_animation(self):
+        """Start moving the trolley along self.trolley_path"""
+        # The extra step is the pause before the operation completes
+        self.animation_step_ms = min(ANIMATION_STEP_MS, MAX_ANIMATION_MS / (len(self.trolley_path) + 1))
+        self.animation_steps = 0
+        self.animation_clock.start()
+        self.animation_timer.start()
+        self.is_animating = True
+
     def animate_trolley(self):
-        """Animate trolley movement"""
+        """Animate trolley movement, taking every path step that is due this frame"""
+        due = int(self.animation_clock.elapsed() // self.animation_step_ms) + 1 - self.animation_steps
+        if due < 1:
+            return
+        
+        self._mark_trolley_dirty()
         if self.trolley_path:
-            next_row, next_col = self.trolley_path.pop(0)
-            self.trolley_row = next_row
-            self.trolley_col = next_col
+            steps = min(due, len(self.trolley_path))
+            self.trolley_row, self.trolley_col = self.trolley_path[steps - 1]
+            del self.trolley_path[:steps]
+            self.animation_steps += steps
+            self._mark_trolley_dirty()
             self.refresh_grid()
-
-            if self.view_stack.currentIndex() == 1: # If 3D view is active
-                self.view_3d_widget.render_realistic_warehouse()
         else:
             self.animation_timer.stop()
             self.is_animating = False
@@ -892,9 +1044,6 @@ class BusinessASRSMainWindow(QMainWindow):
             self.trolley_col = -1
             self.refresh_grid() # To remove trolley from grid
             self.statusBar().showMessage("✅ Operation Complete", 3000)
-        self.refresh_grid()
-
-
 
     def open_analytics(self):
         """Open analytics dashboard"""
@@ -903,32 +1052,40 @@ class BusinessASRSMainWindow(QMainWindow):
     
     def save_state(self):
         """Save warehouse state"""
-        state = {
-            'box_locations': self.rack.box_locations,
-            'grid': [[cell for cell in row] for row in self.rack.grid]
-        }
-        
-        with open(SAVE_FILE, 'w') as f:
-            json.dump(state, f)
+        # Box positions live in the database, so a snapshot of it is the full state
+        snapshot_database(SAVE_FILE)
         
         self.statusBar().showMessage("✅ State saved successfully", 3000)
         self.show_alert("Save Successful", "Warehouse state has been saved successfully!", "info")
     
     def load_state(self):
         """Load warehouse state"""
-        if not os.path.exists(SAVE_FILE):
-            return
-        
         try:
-            with open(SAVE_FILE, 'r') as f:
-                state = json.load(f)
+            self._import_legacy_state()
             
-            self.rack.box_locations = {int(k): tuple(v) for k, v in state['box_locations'].items()}
-            self.rack.grid = state['grid']
+            # Re-place every stored box so the rack's grid and occupancy map stay in sync
+            self.rack = Rack(GRID_ROWS, GRID_COLS)
+            self.rack.load_boxes(get_stored_box_positions())
             
         except Exception as e:
             print(f"Error loading state: {e}")
     
+    def _import_legacy_state(self):
+        """Copy rack positions from an old JSON save into boxes that lack them"""
+        if not os.path.exists(LEGACY_SAVE_FILE):
+            return
+        
+        with open(LEGACY_SAVE_FILE, 'r') as f:
+            state = json.load(f)
+        
+        conn = get_conn()
+        conn.executemany(
+            'UPDATE boxes SET rack_row=?, rack_col=? WHERE box_id=? AND rack_row IS NULL',
+            [(row, col, int(box_id)) for box_id, (row, col, size) in state['box_locations'].items()]
+        )
+        conn.commit()
+        os.remove(LEGACY_SAVE_FILE)
+    
     def reset_warehouse(self):
         """Reset the entire warehouse to a clean state."""
         if self.show_alert(
@@ -940,19 +1097,21 @@ class BusinessASRSMainWindow(QMainWindow):
             self.rack = Rack(GRID_ROWS, GRID_COLS)
 
             # 2. Delete and re-init database
+            close_conn()
             if os.path.exists(DATABASE):
                 os.remove(DATABASE)
             init_database()
 
-            # 3. Delete save file
-            if os.path.exists(SAVE_FILE):
-                os.remove(SAVE_FILE)
+            # 3. Delete save files
+            for path in (SAVE_FILE, LEGACY_SAVE_FILE):
+                if os.path.exists(path):
+                    os.remove(path)
 
             # 4. Refresh UI
             self.log_text.clear()
             self.update_inventory_table()
             self.update_stats()
-            self.refresh_grid()
+            self.refresh_grid(full=True)
             self.load_models()
 
             self.statusBar().showMessage("🔥 Warehouse Reset Successfully", 5000)
@@ -967,5 +1126,6 @@ class BusinessASRSMainWindow(QMainWindow):
         )
         if response:  # User clicked Yes - save and exit
             self.save_state()
+        flush_operation_log()
         # Always accept the event (exit) whether user clicks Yes or No
         event.accept()
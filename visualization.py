@@ -5,12 +5,29 @@ from PySide6.QtWidgets import (
     QPushButton, QLabel, QComboBox, QFrame, QFileDialog, QMessageBox
 )
 from PySide6.QtGui import QColor
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Line3DCollection
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+import numpy as np
 
 from config import COLORS, GRID_ROWS, GRID_COLS, RACK_HEIGHT_LEVELS, AISLE_COUNT, MODEL_ZONES
 from database import get_analytics_data
+from core import EMPTY
+
+# Cuboid corners are ordered bottom (0-3) then top (4-7), counter-clockwise
+# from the origin; CUBOID_FACES picks the four sides and the top
+_UNIT_CORNERS = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+                          [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], dtype=float)
+CUBOID_FACES = np.array([[0, 1, 5, 4], [7, 6, 2, 3], [0, 3, 7, 4], [1, 2, 6, 5], [4, 5, 6, 7]])
+
+def cuboid_corners(origins, sizes):
+    """(N, 8, 3) corners of N axis-aligned cuboids from (N, 3) origins and sizes"""
+    origins = np.asarray(origins, dtype=float)
+    return origins[:, None, :] + _UNIT_CORNERS * np.asarray(sizes, dtype=float).reshape(-1, 1, 3)
+
+def cuboid_faces(origins, sizes):
+    """(N * 5, 4, 3) side and top faces of N cuboids, ready for Poly3DCollection"""
+    return cuboid_corners(origins, sizes)[:, CUBOID_FACES].reshape(-1, 4, 3)
 
 class Realistic3DViewer(QWidget):
     """Professional Realistic 3D Warehouse Rack System"""
@@ -19,6 +36,8 @@ class Realistic3DViewer(QWidget):
         super().__init__(parent)
         self.rack = rack
         self.ax = None
+        self._box_artists = []  # Boxes layer of the current scene
+        self._row_color = np.array([self.get_zone_3d_color(row) for row in range(rack.rows)])
         self.rotation_angle = 45
         self.elevation_angle = 20
         
@@ -55,7 +74,13 @@ class Realistic3DViewer(QWidget):
         """)
         
         self.setup_ui()
-        self.render_realistic_warehouse()
+        # The scene is drawn on first show, so a hidden viewer costs nothing at startup
+    
+    def showEvent(self, event):
+        """Draw the scene the first time the viewer is shown"""
+        super().showEvent(event)
+        if self.ax is None:
+            self.render_realistic_warehouse()
     
     def setup_ui(self):
         """Setup professional UI"""
@@ -154,6 +179,7 @@ class Realistic3DViewer(QWidget):
         stats_layout = QHBoxLayout(stats_frame)
         
         analytics = get_analytics_data()
+        capacity = self.get_capacity()
         
         # Create stat cards
         stats = [
@@ -161,7 +187,7 @@ class Realistic3DViewer(QWidget):
             ("➕ Today Stored", str(analytics['today_stored']), COLORS['success']),
             ("➖ Today Retrieved", str(analytics['today_retrieved']), COLORS['warning']),
             ("📏 Avg Distance", f"{analytics['avg_distance']}m", COLORS['accent']),
-            ("🏗️ Capacity", f"{self.get_capacity()}%", COLORS['danger'] if self.get_capacity() > 80 else COLORS['success'])
+            ("🏗️ Capacity", f"{capacity}%", COLORS['danger'] if capacity > 80 else COLORS['success'])
         ]
         
         for label_text, value_text, color in stats:
@@ -191,30 +217,40 @@ class Realistic3DViewer(QWidget):
     
     def render_realistic_warehouse(self):
         """Render realistic 3D warehouse with vertical rack structures"""
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111, projection='3d', facecolor=COLORS['dark'])
-        
-        self.ax.set_facecolor(COLORS['dark'])
-        self.figure.patch.set_facecolor(COLORS['dark'])
-        
         filter_mode = self.show_racks_check.currentText()
         
-        # Draw floor
-        self.draw_warehouse_floor()
-        
-        # Draw realistic rack structures
-        self.draw_rack_frames()
-        
-        # Draw stored boxes on shelves
+        if self.ax is None:
+            # The floor and racks never change, so they are drawn once and kept
+            self.figure.clear()
+            self.ax = self.figure.add_subplot(111, projection='3d', facecolor=COLORS['dark'])
+            
+            self.ax.set_facecolor(COLORS['dark'])
+            self.figure.patch.set_facecolor(COLORS['dark'])
+            
+            # Draw floor
+            self.draw_warehouse_floor()
+            
+            # Draw realistic rack structures
+            self.draw_rack_frames()
+        else:
+            # Only the boxes layer is redrawn
+            for artist in self._box_artists:
+                artist.remove()
+        
+        # Draw stored boxes on shelves, keeping what was added for the next render
+        collections, lines, texts = len(self.ax.collections), len(self.ax.lines), len(self.ax.texts)
         self.draw_stored_boxes(filter_mode)
+        self._box_artists = (list(self.ax.collections[collections:]) + list(self.ax.lines[lines:])
+                             + list(self.ax.texts[texts:]))
         
         # Clean axes (no graph elements)
         self.clean_axes()
         
         # Set view
-        self.change_view('realistic')
+        self.set_camera('realistic')
         
-        self.canvas.draw()
+        # Coalesces with the canvas's own resize redraw on first show
+        self.canvas.draw_idle()
     
     def draw_warehouse_floor(self):
         """Draw warehouse floor with markings"""
@@ -249,144 +285,77 @@ class Realistic3DViewer(QWidget):
         """Draw realistic rack frame structures"""
         rack_height = RACK_HEIGHT_LEVELS * 1.2
         
-        for row in range(0, GRID_ROWS, 3):  # Rack every 3 rows
-            for col in range(0, GRID_COLS, 5):  # Rack every 5 columns
-                # Vertical posts (4 corners)
-                post_positions = [
-                    (col, row), (col + 0.1, row),
-                    (col, row + 2.9), (col + 0.1, row + 2.9)
-                ]
-                
-                for px, py in post_positions:
-                    self.draw_rack_post(px, py, rack_height)
-                
-                # Horizontal beams (shelves)
-                for level in range(RACK_HEIGHT_LEVELS + 1):
-                    z = level * 1.2
-                    self.draw_rack_beam(col, row, z, 2.9, 0.1)
-    
-    def draw_rack_post(self, x, y, height):
-        """Draw a single vertical rack post"""
-        post_width = 0.08
-        
-        vertices = [
-            [x, y, 0], [x + post_width, y, 0],
-            [x + post_width, y + post_width, 0], [x, y + post_width, 0],
-            [x, y, height], [x + post_width, y, height],
-            [x + post_width, y + post_width, height], [x, y + post_width, height]
-        ]
-        
-        faces = [
-            [vertices[0], vertices[1], vertices[5], vertices[4]],
-            [vertices[7], vertices[6], vertices[2], vertices[3]],
-            [vertices[0], vertices[3], vertices[7], vertices[4]],
-            [vertices[1], vertices[2], vertices[6], vertices[5]],
-            [vertices[4], vertices[5], vertices[6], vertices[7]]
-        ]
-        
-        collection = Poly3DCollection(faces, alpha=0.7,
-                                     facecolor=(0.4, 0.4, 0.42),
-                                     edgecolor=(0.3, 0.3, 0.32), linewidth=0.5)
-        self.ax.add_collection3d(collection)
-    
-    def draw_rack_beam(self, x, y, z, length, width):
-        """Draw horizontal rack beam (shelf)"""
-        beam_height = 0.05
-        
-        vertices = [
-            [x, y, z], [x, y + length, z],
-            [x + width, y + length, z], [x + width, y, z],
-            [x, y, z + beam_height], [x, y + length, z + beam_height],
-            [x + width, y + length, z + beam_height], [x + width, y, z + beam_height]
-        ]
-        
-        faces = [
-            [vertices[0], vertices[1], vertices[5], vertices[4]],
-            [vertices[7], vertices[6], vertices[2], vertices[3]],
-            [vertices[0], vertices[3], vertices[7], vertices[4]],
-            [vertices[1], vertices[2], vertices[6], vertices[5]],
-            [vertices[4], vertices[5], vertices[6], vertices[7]]
-        ]
-        
-        collection = Poly3DCollection(faces, alpha=0.8,
-                                     facecolor=(0.5, 0.5, 0.52),
-                                     edgecolor=(0.4, 0.4, 0.42), linewidth=0.5)
-        self.ax.add_collection3d(collection)
+        # Rack every 3 rows and every 5 columns, as (x, y) of its corner
+        racks = np.array([(col, row) for row in range(0, GRID_ROWS, 3)
+                          for col in range(0, GRID_COLS, 5)], dtype=float)
+        
+        # Vertical posts (4 corners)
+        post_xy = (racks[:, None, :] + [(0, 0), (0.1, 0), (0, 2.9), (0.1, 2.9)]).reshape(-1, 2)
+        posts = cuboid_faces(np.column_stack([post_xy, np.zeros(len(post_xy))]),
+                             (0.08, 0.08, rack_height))
+        self.ax.add_collection3d(Poly3DCollection(posts, alpha=0.7,
+                                                  facecolor=(0.4, 0.4, 0.42),
+                                                  edgecolor=(0.3, 0.3, 0.32), linewidth=0.5))
+        
+        # Horizontal beams (shelves), one per level
+        levels = np.arange(RACK_HEIGHT_LEVELS + 1) * 1.2
+        beam_origins = np.column_stack([np.repeat(racks, len(levels), axis=0),
+                                        np.tile(levels, len(racks))])
+        beams = cuboid_faces(beam_origins, (0.1, 2.9, 0.05))
+        self.ax.add_collection3d(Poly3DCollection(beams, alpha=0.8,
+                                                  facecolor=(0.5, 0.5, 0.52),
+                                                  edgecolor=(0.4, 0.4, 0.42), linewidth=0.5))
     
     def draw_stored_boxes(self, filter_mode):
         """Draw boxes stored on rack shelves"""
-        for row in range(self.rack.rows):
-            for col in range(self.rack.cols):
-                cell_id = self.rack.grid[row][col]
-                
-                if filter_mode == 'Empty Only' and cell_id is not None:
-                    continue
-                if filter_mode == 'Occupied Only' and cell_id is None:
-                    continue
+        grid = self.rack.grid
+        occupied = grid != EMPTY
+        
+        # Shelf level of each row (distribute vertically)
+        row_z = (np.arange(self.rack.rows) % RACK_HEIGHT_LEVELS) * 1.2 + 0.1
+        
+        if filter_mode != 'Empty Only':
+            rows, cols = np.nonzero(occupied)
+            if len(rows):
+                # Occupied - draw realistic boxes/pallets
+                origins = np.column_stack([cols + 0.3, rows + 0.3, row_z[rows]])
+                self.draw_realistic_boxes(origins, (0.8, 0.8, 0.9), self._row_color[rows])
                 
-                # Calculate shelf level (distribute vertically)
-                level = (row % RACK_HEIGHT_LEVELS)
-                z = level * 1.2 + 0.1
-                
-                if cell_id is not None:
-                    # Occupied - draw realistic box/pallet
-                    zone_color = self.get_zone_3d_color(row)
-                    self.draw_realistic_box(col + 0.3, row + 0.3, z, 0.8, 0.8, 0.9, zone_color)
-                    
-                    # Add label
-                    self.ax.text(col + 0.7, row + 0.7, z + 0.5,
-                               str(cell_id), color='white', fontsize=6,
+                # Add labels
+                for row, col, box_id in zip(rows.tolist(), cols.tolist(), grid[rows, cols].tolist()):
+                    self.ax.text(col + 0.7, row + 0.7, row_z[row] + 0.5,
+                               str(box_id), color='white', fontsize=6,
                                ha='center', va='center', weight='bold',
                                bbox=dict(boxstyle='round,pad=0.3', 
                                        facecolor=(0.1, 0.1, 0.1, 0.7),
                                        edgecolor='none'))
-                else:
-                    # Empty shelf slot - draw subtle outline
-                    self.draw_empty_slot(col + 0.3, row + 0.3, z, 0.8, 0.8)
-    
-    def draw_realistic_box(self, x, y, z, width, depth, height, color):
-        """Draw a realistic 3D box/pallet"""
-        vertices = [
-            [x, y, z], [x + width, y, z],
-            [x + width, y + depth, z], [x, y + depth, z],
-            [x, y, z + height], [x + width, y, z + height],
-            [x + width, y + depth, z + height], [x, y + depth, z + height]
-        ]
-        
-        faces = [
-            [vertices[0], vertices[1], vertices[5], vertices[4]],
-            [vertices[7], vertices[6], vertices[2], vertices[3]],
-            [vertices[0], vertices[3], vertices[7], vertices[4]],
-            [vertices[1], vertices[2], vertices[6], vertices[5]],
-            [vertices[4], vertices[5], vertices[6], vertices[7]]
-        ]
         
+        if filter_mode != 'Occupied Only':
+            # Empty shelf slots - draw subtle outlines
+            rows, cols = np.nonzero(~occupied)
+            if len(rows):
+                self.draw_empty_slots(np.column_stack([cols + 0.3, rows + 0.3, row_z[rows]]), 0.8, 0.8)
+    
+    def draw_realistic_boxes(self, origins, size, colors):
+        """Draw realistic 3D boxes/pallets, one RGB color per box"""
+        faces = cuboid_faces(origins, size)
         collection = Poly3DCollection(faces, alpha=0.85,
-                                     facecolor=color,
+                                     facecolor=np.repeat(colors, len(CUBOID_FACES), axis=0),
                                      edgecolor=(0.2, 0.2, 0.25), linewidth=0.8)
         self.ax.add_collection3d(collection)
         
-        # Add pallet base
-        pallet_height = 0.05
-        pallet_faces = [[vertices[0], vertices[1], vertices[2], vertices[3]]]
+        # Add pallet bases
+        pallet_faces = cuboid_corners(origins, size)[:, :4]
         pallet_collection = Poly3DCollection(pallet_faces, alpha=0.6,
                                             facecolor=(0.4, 0.3, 0.2),
                                             edgecolor=(0.3, 0.2, 0.1), linewidth=0.5)
         self.ax.add_collection3d(pallet_collection)
     
-    def draw_empty_slot(self, x, y, z, width, depth):
-        """Draw empty rack slot outline"""
-        # Just draw a faint outline
-        outline = [
-            [x, y, z], [x + width, y, z],
-            [x + width, y + depth, z], [x, y + depth, z], [x, y, z]
-        ]
-        
-        ox = [p[0] for p in outline]
-        oy = [p[1] for p in outline]
-        oz = [p[2] for p in outline]
-        
-        self.ax.plot(ox, oy, oz, color='white', alpha=0.1, linewidth=0.3)
+    def draw_empty_slots(self, origins, width, depth):
+        """Draw faint outlines of empty rack slots, one closed square per (x, y, z) origin"""
+        outlines = np.asarray(origins, dtype=float)[:, None, :] + \
+            np.array([[0, 0, 0], [width, 0, 0], [width, depth, 0], [0, depth, 0], [0, 0, 0]])
+        self.ax.add_collection3d(Line3DCollection(outlines, colors='white', alpha=0.1, linewidths=0.3))
     
     def get_zone_3d_color(self, row):
         """Get realistic zone color"""
@@ -424,6 +393,12 @@ class Realistic3DViewer(QWidget):
         if not self.ax:
             return
         
+        # Only the camera moves, so let Qt coalesce the redraw
+        self.set_camera(mode)
+        self.canvas.draw_idle()
+    
+    def set_camera(self, mode):
+        """Point the camera for a view mode without redrawing"""
         if mode == 'realistic':
             self.ax.view_init(elev=20, azim=45)
         elif mode == 'top':
@@ -432,8 +407,6 @@ class Realistic3DViewer(QWidget):
             self.ax.view_init(elev=5, azim=0)
         elif mode == 'aisle':
             self.ax.view_init(elev=10, azim=90)
-        
-        self.canvas.draw()
     
     def export_view(self):
         """Export current view as image"""